@@ -90,7 +90,24 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with the given connection."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    # Fail fast instead of queueing for a lock: DDL waiting on ACCESS EXCLUSIVE behind a long
+    # query blocks every query that arrives after it. A timed-out run is rolled back (up to the
+    # last autocommit block) and can simply be retried. Session-level, so revisions that build
+    # indexes CONCURRENTLY do so in concurrent_index_block(), which lifts it for the build: a
+    # build that times out waiting for open transactions leaves an INVALID index. No
+    # statement_timeout: concurrent index builds, VACUUMs and batched backfills legitimately
+    # run for a long time.
+    connection.exec_driver_sql(f"SET lock_timeout = '{settings.migration_lock_timeout}'")
+    connection.commit()
+
+    # Run every pending revision in one transaction (one commit for the whole upgrade, rather
+    # than one per revision), so a chain of small revisions costs no more than a single
+    # combined one. Revisions that need to run outside it use autocommit_block().
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transaction_per_migration=False,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
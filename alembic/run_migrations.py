@@ -0,0 +1,30 @@
+"""Standalone database migration runner.
+
+Runs migrations outside application startup, e.g. as a release/pre-deploy job:
+
+    python alembic/run_migrations.py [revision]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.logging import setup_logging  # noqa: E402
+from src.core.migrations import run_migrations  # noqa: E402
+
+
+def main() -> int:
+    """Parse arguments and run the migrations."""
+    parser = argparse.ArgumentParser(description="Run database migrations")
+    parser.add_argument("revision", nargs="?", default="head", help="Target revision")
+    args = parser.parse_args()
+
+    setup_logging()
+    return asyncio.run(run_migrations(args.revision))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""add_audit_data_key_indexes_and_path_ops_gins
+
+Revision ID: 8e4d2b6f1a37
+Revises: 2c7e4a91d5b8
+Create Date: 2026-10-16 13:37:42.806114
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+from src.core.migration_ops import (
+    concurrent_index_block,
+    drop_invalid_index,
+    require_valid_index,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "8e4d2b6f1a37"
+down_revision: str | Sequence[str] | None = "2c7e4a91d5b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# evidence_submissions JSONB columns whose GIN indexes move to jsonb_path_ops
+EVIDENCE_SUBMISSION_GIN_COLUMNS = ("ocr_response", "extracted_fields")
+
+# Session maintenance_work_mem for the GIN builds
+GIN_BUILD_MAINTENANCE_WORK_MEM = "1GB"
+
+
+def upgrade() -> None:
+    """Upgrade schema - index hot audit_data keys and slim the evidence_submissions GINs."""
+    with concurrent_index_block():
+        # list_audits filters on these two audit_data keys with ->>, which the
+        # audit_data GIN (containment only) can't serve; index the exact expressions.
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audits_audit_scope
+            ON audits ((audit_data->'productInfo'->>'auditScope'))
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audits_product_category
+            ON audits ((audit_data->'productInfo'->>'productCategory'))
+        """)
+
+        # jsonb_path_ops GINs are a fraction of the default jsonb_ops size and still serve
+        # @> containment. Build alongside the existing index, then swap it in. GIN builds
+        # collect posting lists in maintenance_work_mem, so raise it while building.
+        op.execute(f"SET maintenance_work_mem = '{GIN_BUILD_MAINTENANCE_WORK_MEM}'")
+        for column in EVIDENCE_SUBMISSION_GIN_COLUMNS:
+            drop_invalid_index(f"idx_evidence_submissions_{column}_path_gin")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evidence_submissions_{column}_path_gin "
+                f"ON evidence_submissions USING gin ({column} jsonb_path_ops)"
+            )
+            require_valid_index(f"idx_evidence_submissions_{column}_path_gin")
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS idx_evidence_submissions_{column}_gin")
+        op.execute("RESET maintenance_work_mem")
+    for column in EVIDENCE_SUBMISSION_GIN_COLUMNS:
+        op.execute(
+            f"ALTER INDEX idx_evidence_submissions_{column}_path_gin "
+            f"RENAME TO idx_evidence_submissions_{column}_gin"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore jsonb_ops GINs and drop the audit_data key indexes."""
+    with concurrent_index_block():
+        for column in EVIDENCE_SUBMISSION_GIN_COLUMNS:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS idx_evidence_submissions_{column}_gin")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evidence_submissions_{column}_gin "
+                f"ON evidence_submissions USING gin ({column})"
+            )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_audits_product_category")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_audits_audit_scope")
@@ -0,0 +1,60 @@
+"""build_audits_audit_data_gin_after_load
+
+Revision ID: e81f3b6d2a47
+Revises: 4c2e8f7a9b31
+Create Date: 2026-10-16 10:41:55.904316
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+from src.core.migration_ops import (
+    concurrent_index_block,
+    drop_invalid_index,
+    require_valid_index,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "e81f3b6d2a47"
+down_revision: str | Sequence[str] | None = "4c2e8f7a9b31"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Session maintenance_work_mem for the GIN build
+GIN_BUILD_MAINTENANCE_WORK_MEM = "1GB"
+
+
+def upgrade() -> None:
+    """Upgrade schema - (re)build the audits.audit_data GIN index with jsonb_path_ops."""
+    # Built post-load and CONCURRENTLY so neither the table migrations nor live writes pay
+    # for the GIN build. jsonb_path_ops is a fraction of the default jsonb_ops size and only
+    # serves @> containment, which is all audit_data is queried with. fastupdate batches
+    # per-insert GIN maintenance through the pending list.
+    # Databases migrated before this revision already have a jsonb_ops index under the final
+    # name, so build the new one alongside, then swap it in.
+    # GIN builds collect posting lists in maintenance_work_mem; the server default forces many
+    # merge passes on a populated table, so raise it for this session while building.
+    # A build interrupted on an earlier run leaves an INVALID index that IF NOT EXISTS would
+    # keep, so drop it first and only swap in an index that is valid.
+    with concurrent_index_block():
+        drop_invalid_index("idx_audits_audit_data_path_gin")
+        op.execute(f"SET maintenance_work_mem = '{GIN_BUILD_MAINTENANCE_WORK_MEM}'")
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audits_audit_data_path_gin
+            ON audits USING gin (audit_data jsonb_path_ops)
+            WITH (fastupdate = on, gin_pending_list_limit = 4096)
+        """)
+        op.execute("RESET maintenance_work_mem")
+        require_valid_index("idx_audits_audit_data_path_gin")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_audits_audit_data_gin")
+    op.execute("ALTER INDEX idx_audits_audit_data_path_gin RENAME TO idx_audits_audit_data_gin")
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore the default jsonb_ops GIN index on audits.audit_data."""
+    with concurrent_index_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_audits_audit_data_gin")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audits_audit_data_gin "
+            "ON audits USING gin (audit_data)"
+        )
@@ -0,0 +1,61 @@
+"""consolidate_evidence_submissions_indexes
+
+Revision ID: 2c7e4a91d5b8
+Revises: b5d18e0c7a29
+Create Date: 2026-10-16 13:05:27.553190
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+from src.core.migration_ops import concurrent_index_block
+
+# revision identifiers, used by Alembic.
+revision: str = "2c7e4a91d5b8"
+down_revision: str | Sequence[str] | None = "b5d18e0c7a29"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - replace single-column evidence_submissions indexes with a partial one."""
+    # Submissions are only ever read per workflow (idx_evidence_submissions_workflow_id), so the
+    # standalone status/created_at/processing_* indexes cost a btree write per INSERT/UPDATE
+    # for no reads. Keep one small partial index for the in-flight submissions that status
+    # and processing time are looked at together for.
+    with concurrent_index_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evidence_submissions_status_time
+            ON evidence_submissions (status, processing_started_at)
+            WHERE status IN ('PENDING_PROCESSING', 'PROCESSING', 'NEEDS_REVIEW')
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_evidence_submissions_status")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_evidence_submissions_created_at")
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS idx_evidence_submissions_processing_started_at"
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS idx_evidence_submissions_processing_completed_at"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore the single-column evidence_submissions indexes."""
+    with concurrent_index_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evidence_submissions_processing_completed_at "
+            "ON evidence_submissions (processing_completed_at)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evidence_submissions_processing_started_at "
+            "ON evidence_submissions (processing_started_at)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evidence_submissions_created_at "
+            "ON evidence_submissions (created_at)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evidence_submissions_status "
+            "ON evidence_submissions (status)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_evidence_submissions_status_time")
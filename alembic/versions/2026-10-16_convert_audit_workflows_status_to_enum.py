@@ -0,0 +1,50 @@
+"""convert_audit_workflows_status_to_enum
+
+Revision ID: 8b0f5e2d7c14
+Revises: 35d71cb64d3a
+Create Date: 2026-10-16 17:05:52.216340
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b0f5e2d7c14"
+down_revision: str | Sequence[str] | None = "35d71cb64d3a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - store audit_workflows.status as an ENUM instead of VARCHAR + CHECK."""
+    op.execute("""
+        CREATE TYPE audit_workflow_status AS ENUM (
+            'GENERATED', 'PROCESSING', 'PROCESSING_COMPLETE', 'PROCESSING_FAILED'
+        )
+    """)
+
+    # Same shape as convert_audits_status_to_enum: one ALTER TABLE, so audit_workflows is
+    # rewritten once, and the enum replaces the CHECK constraint (which the naming
+    # convention created as audit_workflows_audit_workflows_status_check_check)
+    op.execute("""
+        ALTER TABLE audit_workflows
+            DROP CONSTRAINT IF EXISTS audit_workflows_audit_workflows_status_check_check,
+            ALTER COLUMN status DROP DEFAULT,
+            ALTER COLUMN status TYPE audit_workflow_status USING status::audit_workflow_status,
+            ALTER COLUMN status SET DEFAULT 'GENERATED'
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore audit_workflows.status as VARCHAR with a CHECK constraint."""
+    op.execute("""
+        ALTER TABLE audit_workflows
+            ALTER COLUMN status DROP DEFAULT,
+            ALTER COLUMN status TYPE VARCHAR USING status::text,
+            ALTER COLUMN status SET DEFAULT 'GENERATED',
+            ADD CONSTRAINT audit_workflows_audit_workflows_status_check_check CHECK (
+                status IN ('GENERATED', 'PROCESSING', 'PROCESSING_COMPLETE', 'PROCESSING_FAILED')
+            )
+    """)
+    op.execute("DROP TYPE audit_workflow_status")
@@ -0,0 +1,44 @@
+"""convert_audits_status_to_enum
+
+Revision ID: 4c2e8f7a9b31
+Revises: 9dfcc87b0179
+Create Date: 2026-10-16 10:03:17.552108
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c2e8f7a9b31"
+down_revision: str | Sequence[str] | None = "9dfcc87b0179"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - store audits.status as an audit_status ENUM instead of VARCHAR + CHECK."""
+    op.execute("CREATE TYPE audit_status AS ENUM ('DRAFT', 'PUBLISHED')")
+
+    # One ALTER TABLE so audits (and idx_audits_status) is rewritten once. The enum itself
+    # enforces the allowed values, so the CHECK constraint is no longer needed; new statuses
+    # can later be added with ALTER TYPE ... ADD VALUE instead of a drop/recreate.
+    op.execute("""
+        ALTER TABLE audits
+            DROP CONSTRAINT IF EXISTS audits_status_check,
+            ALTER COLUMN status DROP DEFAULT,
+            ALTER COLUMN status TYPE audit_status USING status::audit_status,
+            ALTER COLUMN status SET DEFAULT 'DRAFT'
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore audits.status as VARCHAR with a CHECK constraint."""
+    op.execute("""
+        ALTER TABLE audits
+            ALTER COLUMN status DROP DEFAULT,
+            ALTER COLUMN status TYPE VARCHAR USING status::text,
+            ALTER COLUMN status SET DEFAULT 'DRAFT',
+            ADD CONSTRAINT audits_status_check CHECK (status IN ('DRAFT', 'PUBLISHED'))
+    """)
+    op.execute("DROP TYPE audit_status")
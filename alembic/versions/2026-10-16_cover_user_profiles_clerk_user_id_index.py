@@ -0,0 +1,61 @@
+"""cover_user_profiles_clerk_user_id_index
+
+Revision ID: 3f9b27c4d6e0
+Revises: 7a5d0c93e1f8
+Create Date: 2026-10-16 11:58:43.120977
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+from src.core.migration_ops import (
+    concurrent_index_block,
+    drop_invalid_index,
+    require_valid_index,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9b27c4d6e0"
+down_revision: str | Sequence[str] | None = "7a5d0c93e1f8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - make the clerk_user_id unique index cover id and is_active."""
+    # Every authenticated request looks a profile up by clerk_user_id. A hash index can't
+    # enforce UNIQUE (which get_or_create_user_profile relies on to resolve races), so keep the
+    # btree but INCLUDE id and is_active: id/is_active checks become index-only scans, and the
+    # partial active-profiles index on the same column is no longer needed.
+    with concurrent_index_block():
+        drop_invalid_index("idx_user_profiles_clerk_user_id_covering")
+        op.execute("""
+            CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_user_profiles_clerk_user_id_covering
+            ON user_profiles (clerk_user_id) INCLUDE (id, is_active)
+        """)
+        require_valid_index("idx_user_profiles_clerk_user_id_covering")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_user_profiles_clerk_user_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_user_profiles_active")
+    op.execute(
+        "ALTER INDEX idx_user_profiles_clerk_user_id_covering "
+        "RENAME TO idx_user_profiles_clerk_user_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore the plain clerk_user_id unique index."""
+    with concurrent_index_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_profiles_active
+            ON user_profiles (clerk_user_id) WHERE is_active
+        """)
+        drop_invalid_index("idx_user_profiles_clerk_user_id_plain")
+        op.execute("""
+            CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_user_profiles_clerk_user_id_plain
+            ON user_profiles (clerk_user_id)
+        """)
+        require_valid_index("idx_user_profiles_clerk_user_id_plain")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_user_profiles_clerk_user_id")
+    op.execute(
+        "ALTER INDEX idx_user_profiles_clerk_user_id_plain RENAME TO idx_user_profiles_clerk_user_id"
+    )
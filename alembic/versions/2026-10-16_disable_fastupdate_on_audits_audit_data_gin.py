@@ -0,0 +1,34 @@
+"""disable_fastupdate_on_audits_audit_data_gin
+
+Revision ID: c1482f70744b
+Revises: 28d2070d391c
+Create Date: 2026-10-16 19:03:27.514902
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c1482f70744b"
+down_revision: str | Sequence[str] | None = "28d2070d391c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - write audits.audit_data GIN entries directly, without a pending list."""
+    # With fastupdate, new entries wait in an unsorted pending list that every @> search scans
+    # and some unlucky insert (or autovacuum) has to merge. Audits are written one at a time,
+    # so there is no bulk insert for the list to amortise. Turning it off doesn't flush the
+    # existing list, so merge it into the index now.
+    op.execute("ALTER INDEX idx_audits_audit_data_gin SET (fastupdate = off)")
+    op.execute("ALTER INDEX idx_audits_audit_data_gin RESET (gin_pending_list_limit)")
+    op.execute("SELECT gin_clean_pending_list('idx_audits_audit_data_gin'::regclass)")
+
+
+def downgrade() -> None:
+    """Downgrade schema - batch audits.audit_data GIN updates through the pending list again."""
+    op.execute(
+        "ALTER INDEX idx_audits_audit_data_gin SET (fastupdate = on, gin_pending_list_limit = 4096)"
+    )
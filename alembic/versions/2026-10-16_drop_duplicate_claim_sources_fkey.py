@@ -0,0 +1,31 @@
+"""drop_duplicate_claim_sources_fkey
+
+Revision ID: 7c3e1a9f4b20
+Revises: 5f2a9c7d3e18
+Create Date: 2026-10-16 16:41:07.264810
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3e1a9f4b20"
+down_revision: str | Sequence[str] | None = "5f2a9c7d3e18"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - drop the pre-rename duplicate of the claim sources claim FK."""
+    # rename_workflow_claims_tables_and_columns used to miss this FK (its name was truncated
+    # by the naming convention), so it survived next to
+    # audit_workflow_claim_sources_audit_workflow_claim_id_fkey and every write checked both.
+    op.execute(
+        "ALTER TABLE audit_workflow_claim_sources DROP CONSTRAINT IF EXISTS "
+        "audit_workflow_required_claim_sources_audit_workflow_re_6e2c"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - nothing to restore; the remaining FK enforces the same reference."""
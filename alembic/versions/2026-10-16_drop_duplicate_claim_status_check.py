@@ -0,0 +1,31 @@
+"""drop_duplicate_claim_status_check
+
+Revision ID: 2b8d6f0e1c95
+Revises: 7c3e1a9f4b20
+Create Date: 2026-10-16 17:02:55.803117
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2b8d6f0e1c95"
+down_revision: str | Sequence[str] | None = "7c3e1a9f4b20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - drop the pre-rename duplicate of audit_workflow_claims_status_check."""
+    # rename_workflow_claims_tables_and_columns used to miss this check (its name was
+    # truncated by the naming convention) and added audit_workflow_claims_status_check next to
+    # it, so every write evaluated the same condition twice.
+    op.execute(
+        "ALTER TABLE audit_workflow_claims DROP CONSTRAINT IF EXISTS "
+        "audit_workflow_required_claims_audit_workflow_required__6718"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - nothing to restore; the remaining check enforces the same statuses."""
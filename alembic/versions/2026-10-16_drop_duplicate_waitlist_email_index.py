@@ -0,0 +1,35 @@
+"""drop_duplicate_waitlist_email_index
+
+Revision ID: 0e7b3d5a8c16
+Revises: c81d4f6a9e53
+Create Date: 2026-10-16 15:52:40.118391
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+from src.core.migration_ops import concurrent_index_block
+
+# revision identifiers, used by Alembic.
+revision: str = "0e7b3d5a8c16"
+down_revision: str | Sequence[str] | None = "c81d4f6a9e53"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - drop the unique index duplicating waitlist_entries_email_key."""
+    # waitlist_entries_email_key already enforces (and indexes) email uniqueness, and is the
+    # constraint WaitlistService reports duplicates from; the second unique index on email
+    # only doubled the work of every insert.
+    with concurrent_index_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS waitlist_entries_email_idx")
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore the separate unique index on waitlist_entries.email."""
+    with concurrent_index_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS waitlist_entries_email_idx "
+            "ON waitlist_entries (email)"
+        )
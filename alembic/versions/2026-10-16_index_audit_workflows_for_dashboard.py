@@ -0,0 +1,43 @@
+"""index_audit_workflows_for_dashboard
+
+Revision ID: 28d2070d391c
+Revises: 9afb31b7b9a4
+Create Date: 2026-10-16 18:12:40.318207
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+from src.core.migration_ops import concurrent_index_block
+
+# revision identifiers, used by Alembic.
+revision: str = "28d2070d391c"
+down_revision: str | Sequence[str] | None = "9afb31b7b9a4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - index audit_workflows for the admin dashboard queries."""
+    # The dashboard counts and per-day completions only read PROCESSING_COMPLETE workflows,
+    # by updated_at, and look at their certification: a partial index over those rows with
+    # certification included answers them with an index-only scan. status is constant in
+    # the index, so it isn't a key column. Recent workflows are ordered over all statuses,
+    # so they get a full index in exactly that order for the LIMIT to stop early.
+    with concurrent_index_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_workflows_completed_updated_at
+            ON audit_workflows (updated_at) INCLUDE (certification)
+            WHERE status = 'PROCESSING_COMPLETE'
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_workflows_recent
+            ON audit_workflows (updated_at DESC NULLS LAST, created_at DESC)
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop the admin dashboard indexes."""
+    with concurrent_index_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_audit_workflows_recent")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_audit_workflows_completed_updated_at")
@@ -0,0 +1,43 @@
+"""index_live_brands_by_created_at
+
+Revision ID: 35d71cb64d3a
+Revises: 2b8d6f0e1c95
+Create Date: 2026-10-16 16:41:27.530914
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+from src.core.migration_ops import concurrent_index_block
+
+# revision identifiers, used by Alembic.
+revision: str = "35d71cb64d3a"
+down_revision: str | Sequence[str] | None = "2b8d6f0e1c95"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - replace the brands deleted_at/created_at indexes with a partial one."""
+    # Every brands query filters deleted_at IS NULL, and the brand list orders by created_at.
+    # One index on created_at over live rows serves both (and the list's count); the btree on
+    # the mostly-NULL deleted_at and the one over all rows' created_at serve nothing it doesn't.
+    with concurrent_index_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_brands_live_created_at
+            ON brands (created_at) WHERE deleted_at IS NULL
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_brands_deleted_at")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_brands_created_at")
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore the full brands deleted_at and created_at indexes."""
+    with concurrent_index_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_brands_created_at ON brands (created_at)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_brands_deleted_at ON brands (deleted_at)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_brands_live_created_at")
@@ -0,0 +1,44 @@
+"""index_rules_engine_foreign_keys
+
+Revision ID: 4d8a1c3e5f60
+Revises: 8e4d2b6f1a37
+Create Date: 2026-10-16 14:12:09.341875
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+from src.core.migration_ops import concurrent_index_block
+
+# revision identifiers, used by Alembic.
+revision: str = "4d8a1c3e5f60"
+down_revision: str | Sequence[str] | None = "8e4d2b6f1a37"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index, table, column) for ON DELETE RESTRICT foreign keys into rules / evidence_claims
+# whose column isn't the leading column of any index
+FOREIGN_KEY_INDEXES = (
+    ("idx_audit_workflow_rule_matches_rule_id", "audit_workflow_rule_matches", "rule_id"),
+    ("idx_audit_workflow_claim_sources_rule_id", "audit_workflow_claim_sources", "rule_id"),
+    ("idx_audit_workflow_claims_evidence_claim_id", "audit_workflow_claims", "evidence_claim_id"),
+    ("idx_rule_evidence_claims_evidence_claim_id", "rule_evidence_claims", "evidence_claim_id"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema - index the rules engine's unindexed foreign key columns."""
+    # Without these, deleting (or checking the delete of) a rule or evidence claim scans each
+    # child table for referencing rows, as does any "all rows for this rule/claim" lookup.
+    with concurrent_index_block():
+        for index_name, table, column in FOREIGN_KEY_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table} ({column})"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop the rules engine foreign key indexes."""
+    with concurrent_index_block():
+        for index_name, _table, _column in FOREIGN_KEY_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
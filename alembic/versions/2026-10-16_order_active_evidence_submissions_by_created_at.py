@@ -0,0 +1,42 @@
+"""order_active_evidence_submissions_by_created_at
+
+Revision ID: a3c95e7f1b02
+Revises: 6b1f0e9d2c84
+Create Date: 2026-10-16 15:08:33.915604
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+from src.core.migration_ops import concurrent_index_block
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c95e7f1b02"
+down_revision: str | Sequence[str] | None = "6b1f0e9d2c84"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - key the in-flight evidence_submissions index on created_at."""
+    # Work is picked up oldest first (WHERE status = ... ORDER BY created_at), and pending rows
+    # have no processing_started_at yet, so (status, created_at) serves that scan where
+    # (status, processing_started_at) can't. Still partial: terminal statuses stay out of it.
+    with concurrent_index_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evidence_submissions_status_active
+            ON evidence_submissions (status, created_at)
+            WHERE status IN ('PENDING_PROCESSING', 'PROCESSING', 'NEEDS_REVIEW')
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_evidence_submissions_status_time")
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore the (status, processing_started_at) partial index."""
+    with concurrent_index_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evidence_submissions_status_time
+            ON evidence_submissions (status, processing_started_at)
+            WHERE status IN ('PENDING_PROCESSING', 'PROCESSING', 'NEEDS_REVIEW')
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_evidence_submissions_status_active")
@@ -0,0 +1,34 @@
+"""use_clock_timestamp_created_at_defaults
+
+Revision ID: b5d18e0c7a29
+Revises: 3f9b27c4d6e0
+Create Date: 2026-10-16 12:34:10.418266
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d18e0c7a29"
+down_revision: str | Sequence[str] | None = "3f9b27c4d6e0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("audits", "audit_workflows", "user_profiles")
+
+
+def upgrade() -> None:
+    """Upgrade schema - default created_at to clock_timestamp() on the write-heavy tables."""
+    # now() is the transaction start time, so rows inserted in one transaction (bulk loads,
+    # backfills) all share a created_at. clock_timestamp() keeps them in insertion order.
+    # Changing a default is catalog-only; the column types are left as is, since narrowing
+    # timestamptz precision rewrites the table for no storage saving.
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at SET DEFAULT clock_timestamp()")
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore now() created_at defaults."""
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at SET DEFAULT now()")
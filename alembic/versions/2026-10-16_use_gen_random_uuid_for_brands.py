@@ -0,0 +1,38 @@
+"""use_gen_random_uuid_for_brands
+
+Revision ID: 9afb31b7b9a4
+Revises: 8b0f5e2d7c14
+Create Date: 2026-10-16 17:38:04.661925
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9afb31b7b9a4"
+down_revision: str | Sequence[str] | None = "8b0f5e2d7c14"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - default brands.id to the built-in gen_random_uuid()."""
+    # Same as use_gen_random_uuid_for_evidence_submissions: brands was the last table still
+    # defaulting to uuid-ossp's uuid_generate_v4(). The extension itself is left installed on
+    # existing databases; nothing in the schema depends on it any more.
+    op.execute("ALTER TABLE brands ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore the uuid_generate_v4() default."""
+    # Databases created since the inference schema stopped installing uuid-ossp never had
+    # uuid_generate_v4(); they keep gen_random_uuid()
+    op.execute("""
+        DO $$
+        BEGIN
+            IF to_regprocedure('uuid_generate_v4()') IS NOT NULL THEN
+                ALTER TABLE brands ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+            END IF;
+        END $$;
+    """)
@@ -0,0 +1,37 @@
+"""use_gen_random_uuid_for_evidence_submissions
+
+Revision ID: 6b1f0e9d2c84
+Revises: 4d8a1c3e5f60
+Create Date: 2026-10-16 14:46:51.027733
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6b1f0e9d2c84"
+down_revision: str | Sequence[str] | None = "4d8a1c3e5f60"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - default evidence_submissions.id to the built-in gen_random_uuid()."""
+    # gen_random_uuid() is built into PostgreSQL 13+ and cheaper per call than uuid-ossp's
+    # uuid_generate_v4(); both produce v4 UUIDs. Changing a default is catalog-only.
+    op.execute("ALTER TABLE evidence_submissions ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore the uuid_generate_v4() default."""
+    # Databases created since the inference schema stopped installing uuid-ossp never had
+    # uuid_generate_v4(); they keep gen_random_uuid()
+    op.execute("""
+        DO $$
+        BEGIN
+            IF to_regprocedure('uuid_generate_v4()') IS NOT NULL THEN
+                ALTER TABLE evidence_submissions ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+            END IF;
+        END $$;
+    """)
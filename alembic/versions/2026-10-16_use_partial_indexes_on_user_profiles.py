@@ -0,0 +1,61 @@
+"""use_partial_indexes_on_user_profiles
+
+Revision ID: 7a5d0c93e1f8
+Revises: e81f3b6d2a47
+Create Date: 2026-10-16 11:20:08.671542
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+from src.core.migration_ops import (
+    concurrent_index_block,
+    drop_invalid_index,
+    require_valid_index,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "7a5d0c93e1f8"
+down_revision: str | Sequence[str] | None = "e81f3b6d2a47"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - replace skewed/nullable user_profiles indexes with partial ones."""
+    # is_active is almost always true, so a btree on it is all one value. Index active
+    # profiles by clerk_user_id instead (the lookup the auth dependency does), and only index
+    # last_access_at for profiles that have accessed the app at all.
+    with concurrent_index_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_profiles_active
+            ON user_profiles (clerk_user_id) WHERE is_active
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_user_profiles_is_active")
+
+        drop_invalid_index("idx_user_profiles_last_access_at_partial")
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_profiles_last_access_at_partial
+            ON user_profiles (last_access_at) WHERE last_access_at IS NOT NULL
+        """)
+        require_valid_index("idx_user_profiles_last_access_at_partial")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_user_profiles_last_access_at")
+    op.execute(
+        "ALTER INDEX idx_user_profiles_last_access_at_partial "
+        "RENAME TO idx_user_profiles_last_access_at"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore full user_profiles indexes."""
+    with concurrent_index_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_user_profiles_last_access_at")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_profiles_last_access_at "
+            "ON user_profiles (last_access_at)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_profiles_is_active "
+            "ON user_profiles (is_active)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_user_profiles_active")
@@ -0,0 +1,54 @@
+"""use_path_ops_gin_for_gemini_evaluation_response
+
+Revision ID: 5f2a9c7d3e18
+Revises: 0e7b3d5a8c16
+Create Date: 2026-10-16 16:08:21.530947
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+from src.core.migration_ops import (
+    concurrent_index_block,
+    drop_invalid_index,
+    require_valid_index,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "5f2a9c7d3e18"
+down_revision: str | Sequence[str] | None = "0e7b3d5a8c16"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEX_NAME = "idx_evidence_submissions_gemini_evaluation_response_gin"
+TEMP_INDEX_NAME = "idx_evidence_submissions_gemini_evaluation_response_path_gin"
+
+# Session maintenance_work_mem for the GIN build
+GIN_BUILD_MAINTENANCE_WORK_MEM = "1GB"
+
+
+def upgrade() -> None:
+    """Upgrade schema - move the gemini_evaluation_response GIN to jsonb_path_ops."""
+    # Gemini responses are only searched by @> containment, which jsonb_path_ops serves with a
+    # much smaller index. Build it alongside the existing index, then swap it in.
+    with concurrent_index_block():
+        drop_invalid_index(TEMP_INDEX_NAME)
+        op.execute(f"SET maintenance_work_mem = '{GIN_BUILD_MAINTENANCE_WORK_MEM}'")
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {TEMP_INDEX_NAME} "
+            "ON evidence_submissions USING gin (gemini_evaluation_response jsonb_path_ops)"
+        )
+        op.execute("RESET maintenance_work_mem")
+        require_valid_index(TEMP_INDEX_NAME)
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+    op.execute(f"ALTER INDEX {TEMP_INDEX_NAME} RENAME TO {INDEX_NAME}")
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore the jsonb_ops gemini_evaluation_response GIN."""
+    with concurrent_index_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+            "ON evidence_submissions USING gin (gemini_evaluation_response)"
+        )
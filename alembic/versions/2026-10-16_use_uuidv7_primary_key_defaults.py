@@ -0,0 +1,76 @@
+"""use_uuidv7_primary_key_defaults
+
+Revision ID: 9dfcc87b0179
+Revises: add_overall_score_certification
+Create Date: 2026-10-16 09:12:40.318274
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9dfcc87b0179"
+down_revision: str | Sequence[str] | None = "add_overall_score_certification"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Append-heavy tables whose random v4 primary keys are switched to time-ordered v7
+UUIDV7_TABLES = ("audits", "audit_workflows", "user_profiles")
+
+
+def upgrade() -> None:
+    """Upgrade schema - default append-heavy primary keys to UUIDv7."""
+    # PostgreSQL < 18 has no built-in uuidv7(); define uuid_generate_v7() in SQL unless the
+    # pg_uuidv7 extension (which provides the same name) is already installed. It overlays
+    # the millisecond timestamp on a random v4 UUID and flips the version bits to 7.
+    op.execute("""
+        DO $do$
+        BEGIN
+            IF to_regprocedure('uuid_generate_v7()') IS NULL THEN
+                CREATE FUNCTION uuid_generate_v7() RETURNS uuid AS $fn$
+                    SELECT encode(
+                        set_bit(
+                            set_bit(
+                                overlay(
+                                    uuid_send(gen_random_uuid())
+                                    PLACING substring(
+                                        int8send(
+                                            floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint
+                                        ) FROM 3
+                                    )
+                                    FROM 1 FOR 6
+                                ),
+                                52, 1
+                            ),
+                            53, 1
+                        ),
+                        'hex'
+                    )::uuid
+                $fn$ LANGUAGE sql VOLATILE;
+            END IF;
+        END $do$;
+    """)
+
+    for table_name in UUIDV7_TABLES:
+        op.execute(f"ALTER TABLE {table_name} ALTER COLUMN id SET DEFAULT uuid_generate_v7()")
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore UUIDv4 primary key defaults."""
+    for table_name in UUIDV7_TABLES:
+        op.execute(f"ALTER TABLE {table_name} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+    # Only drop the function if this migration created it (not when owned by pg_uuidv7)
+    op.execute("""
+        DO $$
+        BEGIN
+            IF to_regprocedure('uuid_generate_v7()') IS NOT NULL AND NOT EXISTS (
+                SELECT 1 FROM pg_depend
+                WHERE objid = 'uuid_generate_v7()'::regprocedure
+                AND deptype = 'e'
+            ) THEN
+                DROP FUNCTION uuid_generate_v7();
+            END IF;
+        END $$;
+    """)
@@ -5,3 +5,6 @@ RECENT_WORKFLOWS_LIMIT = 10
 
 # Workflow status for "completed" filter (audit_workflows.status)
 PROCESSING_COMPLETE = "PROCESSING_COMPLETE"
+
+# Seconds a serialized dashboard response is reused before the aggregates are recomputed
+DASHBOARD_CACHE_TTL_SECONDS = 60
@@ -3,14 +3,9 @@
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.admin.schemas import (
-    AdminDashboardResponse,
-    AdminDashboardSummary,
-    CertificationBreakdown,
-    RecentWorkflowItem,
-    WorkflowsCompletedOverTimeItem,
-)
-from src.admin.service import get_dashboard_data
+from src.admin.constants import DASHBOARD_CACHE_TTL_SECONDS
+from src.admin.schemas import AdminDashboardResponse
+from src.admin.service import get_cached_dashboard
 from src.database import get_db
 from src.rules.dependencies import get_admin
 
@@ -21,35 +16,20 @@ router = APIRouter(prefix="/api/v1/admin", tags=["admin", "admin-dashboard"])
     "/dashboard",
     status_code=status.HTTP_200_OK,
     summary="Get admin dashboard",
-    description="Platform-wide metrics, certification breakdown, and recent workflows. Admin only.",
+    description=(
+        "Platform-wide metrics, certification breakdown, and recent workflows. Admin only. "
+        f"Cached for up to {DASHBOARD_CACHE_TTL_SECONDS} seconds."
+    ),
     response_model=AdminDashboardResponse,
 )
 async def get_dashboard(
     _: None = Depends(get_admin),
     db: AsyncSession = Depends(get_db),
 ) -> AdminDashboardResponse:
-    """Return platform-wide dashboard data (summary, certification breakdown, workflows over time, recent workflows)."""
-    data = await get_dashboard_data(db)
-    summary = AdminDashboardSummary(**data["summary"])
-    certification_breakdown = CertificationBreakdown(**data["certification_breakdown"])
-    workflows_completed_over_time = [
-        WorkflowsCompletedOverTimeItem(date=item["date"], completed=item["completed"], passed=item["passed"])
-        for item in data["workflows_completed_over_time"]
-    ]
-    recent_workflows = [
-        RecentWorkflowItem(
-            workflow_id=item["workflow_id"],
-            audit_id=item["audit_id"],
-            product_name=item["product_name"],
-            target_market=item["target_market"],
-            status=item["status"],
-            updated_at=item["updated_at"],
-        )
-        for item in data["recent_workflows"]
-    ]
-    return AdminDashboardResponse(
-        summary=summary,
-        certification_breakdown=certification_breakdown,
-        workflows_completed_over_time=workflows_completed_over_time,
-        recent_workflows=recent_workflows,
-    )
+    """
+    Return platform-wide dashboard data (summary, certification breakdown, workflows over time, recent workflows).
+
+    The dashboard is cached per worker process for DASHBOARD_CACHE_TTL_SECONDS. Writes in the
+    same process clear it; another worker can serve figures that are up to that old.
+    """
+    return await get_cached_dashboard(db)
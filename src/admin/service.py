@@ -1,12 +1,26 @@
 """Admin dashboard service: platform-wide metrics and recent workflows."""
 
+import asyncio
+import time
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
+from pydantic import TypeAdapter
 from sqlalchemy import Date, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.admin.constants import PROCESSING_COMPLETE, RECENT_WORKFLOWS_LIMIT
+from src.admin.constants import (
+    DASHBOARD_CACHE_TTL_SECONDS,
+    PROCESSING_COMPLETE,
+    RECENT_WORKFLOWS_LIMIT,
+)
+from src.admin.schemas import (
+    AdminDashboardResponse,
+    AdminDashboardSummary,
+    CertificationBreakdown,
+    RecentWorkflowItem,
+    WorkflowsCompletedOverTimeItem,
+)
 from src.audit_workflows.models import AuditWorkflow, AuditWorkflowStatus
 from src.audits.models import Audit
 from src.brands.models import Brand
@@ -20,12 +34,21 @@ STATUS_LABELS = {
     AuditWorkflowStatus.PROCESSING_FAILED: "Failed",
 }
 
+# Built once: validates the whole recent workflows list in a single pass
+_RECENT_WORKFLOWS_ADAPTER = TypeAdapter(list[RecentWorkflowItem])
 
-def _extract_product_info(audit_data: dict[str, Any] | None) -> tuple[str | None, str | None]:
+# Last built dashboard as (time.monotonic() when built, validated response). The cache is per
+# process: invalidate_dashboard_cache() clears it after writes in this process, and copies in
+# other workers expire after DASHBOARD_CACHE_TTL_SECONDS. The lock makes concurrent misses
+# wait for one rebuild instead of each running the queries. The generation is bumped on every
+# invalidation, so a rebuild that was querying when a write landed doesn't cache its stale result.
+_dashboard_cache: tuple[float, AdminDashboardResponse] | None = None
+_dashboard_generation = 0
+_dashboard_lock = asyncio.Lock()
+
+
+def _extract_product_info(product_info: Any) -> tuple[str | None, str | None]:
     """Extract productName and targetMarket from audit_data.productInfo."""
-    if not audit_data:
-        return (None, None)
-    product_info = audit_data.get("productInfo")
     if not product_info or not isinstance(product_info, dict):
         return (None, None)
     product_name = product_info.get("productName")
@@ -56,50 +79,35 @@ async def get_dashboard_data(db: AsyncSession) -> dict[str, Any]:
     active_clients_result = await db.execute(active_clients_q)
     active_clients = active_clients_result.scalar_one() or 0
 
-    # --- Completed workflows: total and in last 30 days (by updated_at UTC)
-    total_q = select(func.count()).select_from(AuditWorkflow).where(
-        AuditWorkflow.status == PROCESSING_COMPLETE
-    )
-    total_result = await db.execute(total_q)
-    total_completed = total_result.scalar_one() or 0
-
-    in_30d_q = select(func.count()).select_from(AuditWorkflow).where(
-        AuditWorkflow.status == PROCESSING_COMPLETE,
-        AuditWorkflow.updated_at.isnot(None),
-        AuditWorkflow.updated_at >= cutoff_30d,
+    # --- Completed workflows in one pass over idx_audit_workflows_completed_updated_at: total,
+    # last 30 days (by updated_at UTC), with any certification (for the pass rate) and per
+    # certification level
+    completed_q = (
+        select(
+            func.count().label("total"),
+            func.count()
+            .filter(AuditWorkflow.updated_at.isnot(None), AuditWorkflow.updated_at >= cutoff_30d)
+            .label("in_30d"),
+            func.count().filter(AuditWorkflow.certification.isnot(None)).label("certified"),
+            func.count().filter(AuditWorkflow.certification == "Bronze").label("bronze"),
+            func.count().filter(AuditWorkflow.certification == "Silver").label("silver"),
+            func.count().filter(AuditWorkflow.certification == "Gold").label("gold"),
+        )
+        .select_from(AuditWorkflow)
+        .where(AuditWorkflow.status == PROCESSING_COMPLETE)
     )
-    in_30d_result = await db.execute(in_30d_q)
-    audits_in_last_30_days = in_30d_result.scalar_one() or 0
+    counts = (await db.execute(completed_q)).one()
+    total_completed = counts.total
+    audits_in_last_30_days = counts.in_30d
 
     # --- Pass rate: (workflows with any certification) / total_completed * 100, 0 if 0
-    certified_q = select(func.count()).select_from(AuditWorkflow).where(
-        AuditWorkflow.status == PROCESSING_COMPLETE,
-        AuditWorkflow.certification.isnot(None),
-    )
-    certified_result = await db.execute(certified_q)
-    certified_count = certified_result.scalar_one() or 0
-    pass_rate = (certified_count * 100 // total_completed) if total_completed else 0
+    pass_rate = (counts.certified * 100 // total_completed) if total_completed else 0
     pass_rate = min(100, pass_rate)
 
     # --- Certification breakdown (Bronze, Silver, Gold)
-    bronze_q = select(func.count()).select_from(AuditWorkflow).where(
-        AuditWorkflow.status == PROCESSING_COMPLETE,
-        AuditWorkflow.certification == "Bronze",
-    )
-    silver_q = select(func.count()).select_from(AuditWorkflow).where(
-        AuditWorkflow.status == PROCESSING_COMPLETE,
-        AuditWorkflow.certification == "Silver",
-    )
-    gold_q = select(func.count()).select_from(AuditWorkflow).where(
-        AuditWorkflow.status == PROCESSING_COMPLETE,
-        AuditWorkflow.certification == "Gold",
-    )
-    bronze_result = await db.execute(bronze_q)
-    silver_result = await db.execute(silver_q)
-    gold_result = await db.execute(gold_q)
-    bronze = bronze_result.scalar_one() or 0
-    silver = silver_result.scalar_one() or 0
-    gold = gold_result.scalar_one() or 0
+    bronze = counts.bronze
+    silver = counts.silver
+    gold = counts.gold
 
     # --- Workflows completed over time: completed and passed per day, last 30 days (UTC)
     workflows_over_time_q = (
@@ -129,8 +137,18 @@ async def get_dashboard_data(db: AsyncSession) -> dict[str, Any]:
         workflows_completed_over_time.append({"date": d.isoformat(), "completed": completed, "passed": passed})
 
     # --- Recent workflows: join workflow + audit, order by workflow.updated_at DESC, limit 10
+    # Only the columns the response needs, as plain rows rather than ORM instances
     recent_q = (
-        select(AuditWorkflow, Audit)
+        select(
+            AuditWorkflow.id.label("workflow_id"),
+            AuditWorkflow.status,
+            AuditWorkflow.updated_at,
+            AuditWorkflow.created_at,
+            Audit.id.label("audit_id"),
+            # Only productInfo leaves the database, not the whole audit_data document
+            Audit.audit_data["productInfo"].label("product_info"),
+        )
+        .select_from(AuditWorkflow)
         .join(Audit, AuditWorkflow.audit_id == Audit.id)
         .order_by(
             AuditWorkflow.updated_at.desc().nulls_last(),
@@ -142,14 +160,14 @@ async def get_dashboard_data(db: AsyncSession) -> dict[str, Any]:
     rows = recent_result.all()
 
     recent_workflows = []
-    for workflow, audit in rows:
-        product_name, target_market = _extract_product_info(audit.audit_data)
-        status_label = STATUS_LABELS.get(workflow.status, workflow.status or "Unknown")
-        updated_at = workflow.updated_at or workflow.created_at
+    for row in rows:
+        product_name, target_market = _extract_product_info(row.product_info)
+        status_label = STATUS_LABELS.get(row.status, row.status or "Unknown")
+        updated_at = row.updated_at or row.created_at
         recent_workflows.append(
             {
-                "workflow_id": str(workflow.id),
-                "audit_id": str(audit.id),
+                "workflow_id": str(row.workflow_id),
+                "audit_id": str(row.audit_id),
                 "product_name": product_name,
                 "target_market": target_market,
                 "status": status_label,
@@ -168,3 +186,57 @@ async def get_dashboard_data(db: AsyncSession) -> dict[str, Any]:
         "workflows_completed_over_time": workflows_completed_over_time,
         "recent_workflows": recent_workflows,
     }
+
+
+def invalidate_dashboard_cache() -> None:
+    """Drop this process's cached dashboard so the next request rebuilds it.
+
+    Called after writes that change what the dashboard shows: audits and workflow status
+    and scores.
+    """
+    global _dashboard_cache, _dashboard_generation
+    _dashboard_generation += 1
+    _dashboard_cache = None
+
+
+def _cached_dashboard() -> AdminDashboardResponse | None:
+    """Return the cached dashboard if it is younger than DASHBOARD_CACHE_TTL_SECONDS."""
+    if _dashboard_cache is None:
+        return None
+    built_at, dashboard = _dashboard_cache
+    if time.monotonic() - built_at >= DASHBOARD_CACHE_TTL_SECONDS:
+        return None
+    return dashboard
+
+
+async def get_cached_dashboard(db: AsyncSession) -> AdminDashboardResponse:
+    """Return the dashboard, rebuilding it when the cached one is missing or expired."""
+    global _dashboard_cache
+    dashboard = _cached_dashboard()
+    if dashboard is None:
+        async with _dashboard_lock:
+            # Another request may have rebuilt the cache while this one waited for the lock
+            dashboard = _cached_dashboard()
+            if dashboard is None:
+                generation = _dashboard_generation
+                dashboard = await build_dashboard(db)
+                if generation == _dashboard_generation:
+                    _dashboard_cache = (time.monotonic(), dashboard)
+    return dashboard
+
+
+async def build_dashboard(db: AsyncSession) -> AdminDashboardResponse:
+    """Compute the dashboard from the database and validate it."""
+    data = await get_dashboard_data(db)
+    summary = AdminDashboardSummary(**data["summary"])
+    certification_breakdown = CertificationBreakdown(**data["certification_breakdown"])
+    workflows_completed_over_time = [
+        WorkflowsCompletedOverTimeItem(**item) for item in data["workflows_completed_over_time"]
+    ]
+    recent_workflows = _RECENT_WORKFLOWS_ADAPTER.validate_python(data["recent_workflows"])
+    return AdminDashboardResponse(
+        summary=summary,
+        certification_breakdown=certification_breakdown,
+        workflows_completed_over_time=workflows_completed_over_time,
+        recent_workflows=recent_workflows,
+    )
@@ -12,11 +12,14 @@ from sqlalchemy import (
     Index,
     Integer,
     String,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlmodel import Field, SQLModel
 
+from src.core.ids import uuid7
+
 
 class AuditWorkflowStatus:
     GENERATED = "GENERATED"
@@ -30,18 +33,27 @@ class AuditWorkflow(SQLModel, table=True):
 
     __tablename__ = "audit_workflows"
     __table_args__ = (
-        CheckConstraint(
-            "status IN ('GENERATED', 'PROCESSING', 'PROCESSING_COMPLETE', 'PROCESSING_FAILED')",
-            name="audit_workflows_status_check",
-        ),
         CheckConstraint(
             "certification IS NULL OR certification IN ('Bronze', 'Silver', 'Gold')",
             name="audit_workflows_certification_check",
         ),
+        # Admin dashboard: completed-workflow counts by updated_at and certification, and
+        # the most recently updated workflows
+        Index(
+            "idx_audit_workflows_completed_updated_at",
+            "updated_at",
+            postgresql_include=["certification"],
+            postgresql_where=text("status = 'PROCESSING_COMPLETE'"),
+        ),
+        Index(
+            "idx_audit_workflows_recent",
+            text("updated_at DESC NULLS LAST"),
+            text("created_at DESC"),
+        ),
     )
 
     id: UUID = Field(
-        default_factory=uuid4,
+        default_factory=uuid7,
         sa_column=Column(PostgresUUID(as_uuid=True), primary_key=True),
     )
     audit_id: UUID = Field(
@@ -54,7 +66,18 @@ class AuditWorkflow(SQLModel, table=True):
     )
     status: str = Field(
         default=AuditWorkflowStatus.GENERATED,
-        sa_column=Column(String, nullable=False, server_default=AuditWorkflowStatus.GENERATED),
+        sa_column=Column(
+            ENUM(
+                AuditWorkflowStatus.GENERATED,
+                AuditWorkflowStatus.PROCESSING,
+                AuditWorkflowStatus.PROCESSING_COMPLETE,
+                AuditWorkflowStatus.PROCESSING_FAILED,
+                name="audit_workflow_status",
+                create_type=False,
+            ),
+            nullable=False,
+            server_default=AuditWorkflowStatus.GENERATED,
+        ),
     )
     engine_version: str = Field(
         default="v1",
@@ -86,6 +109,7 @@ class AuditWorkflowRuleMatch(SQLModel, table=True):
     """Rule evaluation result for a workflow."""
 
     __tablename__ = "audit_workflow_rule_matches"
+    __table_args__ = (Index("idx_audit_workflow_rule_matches_rule_id", "rule_id"),)
 
     id: UUID = Field(
         default_factory=uuid4,
@@ -131,6 +155,7 @@ class AuditWorkflowClaim(SQLModel, table=True):
             "evidence_claim_id",
             unique=True,
         ),
+        Index("idx_audit_workflow_claims_evidence_claim_id", "evidence_claim_id"),
     )
 
     id: UUID = Field(
@@ -177,6 +202,7 @@ class AuditWorkflowClaimSource(SQLModel, table=True):
             "rule_id",
             unique=True,
         ),
+        Index("idx_audit_workflow_claim_sources_rule_id", "rule_id"),
     )
 
     audit_workflow_claim_id: UUID = Field(
@@ -4,6 +4,7 @@ import logging
 from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -30,6 +31,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/audits", tags=["audit-workflows"])
 
+# Built once: validates a whole page of workflows in a single pass
+_WORKFLOW_SUMMARIES_ADAPTER = TypeAdapter(list[WorkflowSummary])
+
 
 @router.post(
     "/{audit_id}/workflow/generate",
@@ -72,7 +76,7 @@ async def list_workflows(
     )
 
     return WorkflowListResponse(
-        items=[WorkflowSummary.model_validate(w, from_attributes=True) for w in workflows],
+        items=_WORKFLOW_SUMMARIES_ADAPTER.validate_python(workflows, from_attributes=True),
         total=total,
         limit=limit,
         offset=offset,
@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, SkipValidation, field_validator
 
 from src.evidence_submissions.schemas import EvidenceEvaluationSummary
 
@@ -71,7 +71,9 @@ class WorkflowResponse(BaseModel):
     data_completeness: int | None = Field(
         None, alias="dataCompleteness", serialization_alias="dataCompleteness"
     )
-    category_scores: dict | None = Field(
+    # Only ever written by _calculate_workflow_scores (never external input), so the stored
+    # JSONB is passed through as is instead of re-walked per response
+    category_scores: SkipValidation[dict | None] = Field(
         None, alias="categoryScores", serialization_alias="categoryScores"
     )
     overall_score: int | None = Field(
@@ -128,7 +130,7 @@ class WorkflowSummary(BaseModel):
     data_completeness: int | None = Field(
         None, alias="dataCompleteness", serialization_alias="dataCompleteness"
     )
-    category_scores: dict | None = Field(
+    category_scores: SkipValidation[dict | None] = Field(
         None, alias="categoryScores", serialization_alias="categoryScores"
     )
     overall_score: int | None = Field(
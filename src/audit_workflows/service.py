@@ -7,6 +7,7 @@ from uuid import UUID
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.admin.service import invalidate_dashboard_cache
 from src.audit_workflows.models import (
     AuditWorkflow,
     AuditWorkflowClaim,
@@ -61,6 +62,7 @@ class WorkflowSubmissionService:
 
         await db.commit()
         await db.refresh(workflow)
+        invalidate_dashboard_cache()
 
         return workflow
 
@@ -119,6 +121,7 @@ class WorkflowSubmissionService:
                         workflow.status = AuditWorkflowStatus.PROCESSING_FAILED
                         workflow.updated_at = datetime.now(UTC)
                         await status_db.commit()
+                        invalidate_dashboard_cache()
                         logger.error(
                             f"Updated workflow {workflow_id} status to PROCESSING_FAILED after error. "
                             f"Error Type: {error_details['error_type']}, "
@@ -425,6 +428,7 @@ class WorkflowSubmissionService:
         workflow.updated_at = datetime.now(UTC)
         await db.commit()
         await db.refresh(workflow)
+        invalidate_dashboard_cache()
 
         if failed_count > 0:
             logger.warning(
@@ -485,6 +489,7 @@ class WorkflowSubmissionService:
             workflow.updated_at = datetime.now(UTC)
             await db.commit()
             await db.refresh(workflow)
+            invalidate_dashboard_cache()
 
         except Exception as score_error:
             logger.error(
@@ -648,6 +653,7 @@ class WorkflowService:
 
         await db.commit()
         await db.refresh(workflow)
+        invalidate_dashboard_cache()
 
         return workflow
 
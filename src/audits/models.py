@@ -2,13 +2,15 @@
 
 from datetime import datetime
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Index, String
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Column, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlmodel import Field, SQLModel
 
+from src.core.ids import uuid7
+
 
 class AuditStatus:
     """Audit status constants."""
@@ -23,7 +25,7 @@ class Audit(SQLModel, table=True):
     __tablename__ = "audits"
 
     id: UUID = Field(
-        default_factory=uuid4,
+        default_factory=uuid7,
         sa_column=Column(PostgresUUID(as_uuid=True), primary_key=True),
     )
     brand_id: UUID = Field(
@@ -36,7 +38,17 @@ class Audit(SQLModel, table=True):
     )
     status: str = Field(
         default=AuditStatus.DRAFT,
-        sa_column=Column(String, nullable=False, server_default="DRAFT", index=True),
+        sa_column=Column(
+            ENUM(
+                AuditStatus.DRAFT,
+                AuditStatus.PUBLISHED,
+                name="audit_status",
+                create_type=False,
+            ),
+            nullable=False,
+            server_default=AuditStatus.DRAFT,
+            index=True,
+        ),
     )
     audit_data: dict[str, Any] = Field(
         default_factory=dict, sa_column=Column(JSONB, nullable=False)
@@ -55,9 +67,13 @@ class Audit(SQLModel, table=True):
             "idx_audits_audit_data_gin",
             "audit_data",
             postgresql_using="gin",
+            postgresql_ops={"audit_data": "jsonb_path_ops"},
+            postgresql_with={"fastupdate": "off"},
         ),
-        CheckConstraint(
-            "status IN ('DRAFT', 'PUBLISHED')",
-            name="audits_status_check",
+        # Expression indexes for the audit_data keys list_audits filters on
+        Index("idx_audits_audit_scope", text("(audit_data->'productInfo'->>'auditScope')")),
+        Index(
+            "idx_audits_product_category",
+            text("(audit_data->'productInfo'->>'productCategory')"),
         ),
     )
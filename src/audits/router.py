@@ -1,8 +1,10 @@
 """Audits domain router."""
 
 import logging
+from typing import Literal
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.audits.schemas import (
@@ -21,6 +23,17 @@ from src.database import get_db
 router = APIRouter(prefix="/api/v1", tags=["audits"])
 logger = logging.getLogger(__name__)
 
+# Accepted list filter values, mapped to their typed form with a single dict lookup
+_STATUS_FILTERS: dict[str, Literal["DRAFT", "PUBLISHED"]] = {
+    "DRAFT": "DRAFT",
+    "PUBLISHED": "PUBLISHED",
+}
+_SCOPE_FILTERS: dict[str, Literal["Single Product", "Collection", "Brand-wide"]] = {
+    "Single Product": "Single Product",
+    "Collection": "Collection",
+    "Brand-wide": "Brand-wide",
+}
+
 
 @router.post(
     "/audits",
@@ -75,43 +88,37 @@ async def list_audits(
     current_user: UserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> AuditListResponse:
-    """List audits with pagination and optional filtering."""
-
-    from typing import cast
-    from uuid import UUID
+    """
+    List audits with pagination and optional filtering.
 
-    from fastapi import HTTPException
-
-    # Validate status if provided
-    if status is not None and status not in ("DRAFT", "PUBLISHED"):
+    An invalid brand_id, status or scope is rejected with a 400.
+    """
+    status_filter = _STATUS_FILTERS.get(status) if status is not None else None
+    if status is not None and status_filter is None:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid status: {status}. Must be 'DRAFT' or 'PUBLISHED'",
         )
 
-    # Validate scope if provided
-    if scope is not None and scope not in ("Single Product", "Collection", "Brand-wide"):
+    scope_filter = _SCOPE_FILTERS.get(scope) if scope is not None else None
+    if scope is not None and scope_filter is None:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid scope: {scope}. Must be 'Single Product', 'Collection', or 'Brand-wide'",
         )
 
-    # Type narrowing for Literal types
-    from typing import Literal
-
-    status_literal: Literal["DRAFT", "PUBLISHED"] | None = (
-        cast(Literal["DRAFT", "PUBLISHED"], status) if status in ("DRAFT", "PUBLISHED") else None
-    )
-    scope_literal: Literal["Single Product", "Collection", "Brand-wide"] | None = (
-        cast(Literal["Single Product", "Collection", "Brand-wide"], scope)
-        if scope in ("Single Product", "Collection", "Brand-wide")
-        else None
-    )
+    try:
+        brand_uuid = UUID(brand_id) if brand_id else None
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid brand_id: {brand_id}. Must be a UUID",
+        ) from None
 
     query = AuditListQuery(
-        brand_id=UUID(brand_id) if brand_id else None,
-        status=status_literal,
-        scope=scope_literal,
+        brand_id=brand_uuid,
+        status=status_filter,
+        scope=scope_filter,
         category=category,
         limit=limit,
         offset=offset,
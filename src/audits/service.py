@@ -7,6 +7,7 @@ from uuid import UUID
 from sqlalchemy import bindparam, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.admin.service import invalidate_dashboard_cache
 from src.audits.exceptions import AuditNotFoundError, AuditPublishedError
 from src.audits.models import Audit, AuditStatus
 from src.audits.schemas import AuditListQuery, CreateAuditRequest, UpdateAuditRequest
@@ -57,6 +58,7 @@ class AuditService:
         db.add(audit)
         await db.commit()
         await db.refresh(audit)
+        invalidate_dashboard_cache()
 
         logger.info(f"Created audit: id={audit.id}, brand_id={audit.brand_id}, status=DRAFT")
         return audit
@@ -168,6 +170,7 @@ class AuditService:
 
         await db.commit()
         await db.refresh(audit)
+        invalidate_dashboard_cache()
 
         logger.info(f"Updated audit: id={audit.id}, status=DRAFT")
         return audit
@@ -1,12 +1,14 @@
 """Authentication domain database models."""
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import Boolean, Column, DateTime, String, UniqueConstraint
+from sqlalchemy import Boolean, Column, DateTime, Index, String, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlmodel import Field, SQLModel
 
+from src.core.ids import uuid7
+
 
 class UserProfile(SQLModel, table=True):
     """User profile model."""
@@ -14,12 +16,12 @@ class UserProfile(SQLModel, table=True):
     __tablename__ = "user_profiles"
 
     id: UUID = Field(
-        default_factory=uuid4,
+        default_factory=uuid7,
         sa_column=Column(PostgresUUID(as_uuid=True), primary_key=True),
     )
-    clerk_user_id: str = Field(sa_column=Column(String, nullable=False, unique=True, index=True))
+    clerk_user_id: str = Field(sa_column=Column(String, nullable=False, unique=True))
     is_active: bool = Field(
-        default=True, sa_column=Column(Boolean, nullable=False, server_default="true", index=True)
+        default=True, sa_column=Column(Boolean, nullable=False, server_default="true")
     )
     created_at: datetime = Field(
         default_factory=datetime.utcnow,
@@ -29,8 +31,19 @@ class UserProfile(SQLModel, table=True):
         default=None,
         sa_column=Column(DateTime(timezone=True), nullable=True),
     )
-    last_access_at: datetime | None = Field(
-        default=None, sa_column=Column(DateTime(timezone=True), index=True)
-    )
+    last_access_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True)))
 
-    __table_args__ = (UniqueConstraint("clerk_user_id", name="user_profiles_clerk_user_id_key"),)
+    __table_args__ = (
+        UniqueConstraint("clerk_user_id", name="user_profiles_clerk_user_id_key"),
+        Index(
+            "idx_user_profiles_clerk_user_id",
+            "clerk_user_id",
+            unique=True,
+            postgresql_include=["id", "is_active"],
+        ),
+        Index(
+            "idx_user_profiles_last_access_at",
+            "last_access_at",
+            postgresql_where=text("last_access_at IS NOT NULL"),
+        ),
+    )
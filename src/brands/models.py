@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, String
+from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlmodel import Field, SQLModel
@@ -34,12 +34,10 @@ class Brand(SQLModel, table=True):
             index=True,
         ),
     )
-    deleted_at: datetime | None = Field(
-        default=None, sa_column=Column(DateTime(timezone=True), index=True)
-    )
+    deleted_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True)))
     created_at: datetime = Field(
         default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), index=True),
+        sa_column=Column(DateTime(timezone=True)),
     )
     updated_at: datetime | None = Field(
         default=None,
@@ -50,4 +48,9 @@ class Brand(SQLModel, table=True):
         CheckConstraint(
             "company_size IN ('Micro', 'SME', 'Large')", name="brands_company_size_check"
         ),
+        Index(
+            "idx_brands_live_created_at",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
     )
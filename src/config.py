@@ -1,6 +1,6 @@
 """Global configuration using Pydantic BaseSettings."""
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -11,6 +11,14 @@ class Settings(BaseSettings):
 
     # Database Configuration
     database_url: str = ""
+    # Prepared statements kept per pooled asyncpg connection (SQLAlchemy's default is 100);
+    # 0 disables this cache, though asyncpg still prepares each statement it runs
+    database_statement_cache_size: int = 500
+    # How startup handles migrations: "sync" runs them before serving, "skip" leaves them
+    # to `alembic/run_migrations.py` / `alembic upgrade`
+    migration_mode: Literal["sync", "skip"] = "skip"
+    # lock_timeout for migration sessions ("0" waits indefinitely)
+    migration_lock_timeout: str = "2s"
 
     # API Configuration
     api_v1_prefix: str = "/api/v1"
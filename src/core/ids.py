@@ -0,0 +1,46 @@
+"""Identifier generation helpers."""
+
+import os
+import threading
+import time
+from uuid import UUID
+
+_RAND_B_MASK = (1 << 62) - 1
+# rand_a (12 bits) and rand_b (62 bits) together
+_RAND_BITS = 74
+
+_lock = threading.Lock()
+_last_timestamp_ms = 0
+_last_rand = 0
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The first 48 bits are the Unix timestamp in milliseconds, so keys created close together
+    sort together and primary key inserts land on the right-most B-tree page rather than a
+    random one. Within a millisecond (or if the clock steps back) the previous timestamp is
+    kept and the random bits are incremented, so keys from one process are strictly increasing.
+    """
+    global _last_timestamp_ms, _last_rand
+
+    timestamp_ms = time.time_ns() // 1_000_000
+    with _lock:
+        if timestamp_ms > _last_timestamp_ms:
+            # Top random bit starts clear, leaving room to increment within the millisecond
+            rand = int.from_bytes(os.urandom(10), "big") >> (80 - _RAND_BITS + 1)
+        else:
+            timestamp_ms = _last_timestamp_ms
+            rand = _last_rand + 1
+            if rand >> _RAND_BITS:
+                timestamp_ms += 1
+                rand = int.from_bytes(os.urandom(10), "big") >> (80 - _RAND_BITS + 1)
+        _last_timestamp_ms = timestamp_ms
+        _last_rand = rand
+
+    value = (timestamp_ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76  # version
+    value |= ((rand >> 62) & 0xFFF) << 64  # rand_a
+    value |= 0b10 << 62  # variant
+    value |= rand & _RAND_B_MASK  # rand_b
+    return UUID(int=value)
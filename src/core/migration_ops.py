@@ -0,0 +1,58 @@
+"""Helpers for Alembic revisions.
+
+Kept free of database/engine imports so revision scripts can be loaded (``alembic history``,
+``alembic heads``) without a configured database.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import text
+
+from alembic import op
+from src.config import settings
+
+
+@contextmanager
+def concurrent_index_block() -> Iterator[None]:
+    """
+    Run CREATE/DROP INDEX CONCURRENTLY outside the migration transaction, without lock_timeout.
+
+    Like ``op.get_context().autocommit_block()``, but with the session's migration
+    lock_timeout switched off inside. A concurrent build waits for every transaction open when
+    it starts; timing that wait out leaves an INVALID index behind. The build only takes
+    SHARE UPDATE EXCLUSIVE, so waiting doesn't block reads or writes. The migration
+    lock_timeout is restored on the way out.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("SET lock_timeout = 0")
+        try:
+            yield
+        finally:
+            op.execute(f"SET lock_timeout = '{settings.migration_lock_timeout}'")
+
+
+def _index_valid(name: str) -> bool | None:
+    """pg_index.indisvalid for index ``name``, or None if it doesn't exist."""
+    return op.get_bind().scalar(
+        text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": name},
+    )
+
+
+def drop_invalid_index(name: str) -> None:
+    """
+    Drop index ``name`` if an interrupted concurrent build left it INVALID.
+
+    A failed CREATE INDEX CONCURRENTLY keeps the index in the catalog, so a retried
+    ``CREATE INDEX CONCURRENTLY IF NOT EXISTS`` would skip it. Call inside
+    ``concurrent_index_block()`` before building so the retry starts from scratch.
+    """
+    if _index_valid(name) is False:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def require_valid_index(name: str) -> None:
+    """Raise unless index ``name`` exists and is valid, before dropping what it replaces."""
+    if not _index_valid(name):
+        raise RuntimeError(f"Index {name} is missing or INVALID; not swapping it in")
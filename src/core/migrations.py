@@ -0,0 +1,123 @@
+"""Database migration runner.
+
+Runs ``alembic upgrade`` in a subprocess so long migrations (concurrent index builds,
+batched backfills) never block the event loop, and can run outside application startup.
+"""
+
+import asyncio
+import functools
+import logging
+import sys
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+
+from src.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+ALEMBIC_INI = PROJECT_ROOT / "alembic.ini"
+
+# Warn when a migration has produced no output for this long (e.g. waiting on a lock)
+STUCK_WARNING_SECONDS = 60
+
+
+class MigrationState:
+    """Migration status constants."""
+
+    NOT_STARTED = "not_started"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+# Status of the migration run started by this process (reported by /health/migration)
+migration_state = MigrationState.NOT_STARTED
+
+
+async def run_migrations(revision: str = "head") -> int:
+    """
+    Upgrade the database to a revision with ``alembic upgrade``.
+
+    Alembic output is streamed to the log line by line; if nothing is printed for
+    STUCK_WARNING_SECONDS a warning is logged (the run is not cancelled).
+
+    Args:
+        revision: Target revision
+
+    Returns:
+        int: Exit code of the alembic process (0 on success)
+    """
+    global migration_state
+    migration_state = MigrationState.RUNNING
+    logger.info(f"Running database migrations: upgrade {revision}")
+
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "alembic",
+        "-c",
+        str(ALEMBIC_INI),
+        "upgrade",
+        revision,
+        cwd=PROJECT_ROOT,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    assert process.stdout is not None
+
+    idle_seconds = 0
+    while True:
+        try:
+            line = await asyncio.wait_for(process.stdout.readline(), timeout=STUCK_WARNING_SECONDS)
+        except TimeoutError:
+            idle_seconds += STUCK_WARNING_SECONDS
+            logger.warning(f"Database migrations have produced no output for {idle_seconds}s")
+            continue
+        if not line:
+            break
+        idle_seconds = 0
+        logger.info(line.decode(errors="replace").rstrip())
+
+    return_code = await process.wait()
+    if return_code == 0:
+        migration_state = MigrationState.SUCCEEDED
+        logger.info("Database migrations completed")
+    else:
+        migration_state = MigrationState.FAILED
+        logger.error(f"Database migrations failed with exit code {return_code}")
+    return return_code
+
+
+@functools.cache
+def get_head_revision() -> str | None:
+    """
+    Get the head revision of the migration scripts.
+
+    The scripts can't change while the process runs, so the result is cached.
+
+    Returns:
+        str | None: Head revision identifier
+    """
+    script = ScriptDirectory.from_config(Config(str(ALEMBIC_INI)))
+    return script.get_current_head()
+
+
+async def get_current_revision() -> str | None:
+    """
+    Get the revision the database is currently at.
+
+    Returns:
+        str | None: Current revision, or None if the database has not been migrated
+
+    Raises:
+        SQLAlchemyError: If the database can't be queried
+    """
+    async with AsyncSessionLocal() as session:
+        if await session.scalar(text("SELECT to_regclass('alembic_version')")) is None:
+            return None
+        result = await session.execute(text("SELECT version_num FROM alembic_version"))
+        return result.scalar_one_or_none()
@@ -22,6 +22,9 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    # Every request runs the same handful of parameterized queries; keep them all prepared
+    # on each connection so they are parsed and planned once per connection, not per call
+    connect_args={"prepared_statement_cache_size": settings.database_statement_cache_size},
 )
 
 # Create async session factory
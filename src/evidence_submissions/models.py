@@ -1,7 +1,7 @@
 """Evidence submissions domain database models."""
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import (
     BigInteger,
@@ -13,11 +13,13 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlmodel import Field, SQLModel
 
+from src.core.ids import uuid7
 from src.evidence_submissions.constants import SubmissionStatus
 
 
@@ -44,14 +46,16 @@ class EvidenceSubmission(SQLModel, table=True):
         ),
         Index("idx_evidence_submissions_workflow_id", "audit_workflow_id"),
         Index("idx_evidence_submissions_claim_id", "audit_workflow_claim_id"),
-        Index("idx_evidence_submissions_status", "status"),
-        Index("idx_evidence_submissions_created_at", "created_at"),
-        Index("idx_evidence_submissions_processing_started_at", "processing_started_at"),
-        Index("idx_evidence_submissions_processing_completed_at", "processing_completed_at"),
+        Index(
+            "idx_evidence_submissions_status_active",
+            "status",
+            "created_at",
+            postgresql_where=text("status IN ('PENDING_PROCESSING', 'PROCESSING', 'NEEDS_REVIEW')"),
+        ),
     )
 
     id: UUID = Field(
-        default_factory=uuid4,
+        default_factory=uuid7,
         sa_column=Column(PostgresUUID(as_uuid=True), primary_key=True),
     )
     audit_workflow_id: UUID = Field(
@@ -4,6 +4,7 @@ import logging
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,6 +23,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/audits", tags=["evidence-submissions"])
 
+# Built once: validates all of a workflow's submissions in a single pass
+_SUBMISSIONS_ADAPTER = TypeAdapter(list[EvidenceSubmissionResponse])
+
 
 @router.get(
     "/{audit_id}/workflows/{workflow_id}/submissions",
@@ -61,7 +65,7 @@ async def get_submissions_for_workflow(
     result = await db.execute(query)
     submissions = list(result.scalars().all())
 
-    return [EvidenceSubmissionResponse.model_validate(s, from_attributes=True) for s in submissions]
+    return _SUBMISSIONS_ADAPTER.validate_python(submissions, from_attributes=True)
 
 
 @router.get(
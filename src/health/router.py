@@ -6,6 +6,7 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, status
 
 from src.config import settings
+from src.core import migrations
 from src.core.dependencies import get_request_id
 from src.database import check_database_health
 from src.health.schemas import HealthCheck, HealthResponse
@@ -91,3 +92,64 @@ async def database_health_check(
             ).model_dump(),
         },
     )
+
+
+@router.get(
+    "/health/migration",
+    response_model=HealthResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Migration health check",
+    description="Check whether the database schema is at the latest migration. Compares the database's current Alembic revision with the head revision of the migration scripts, and reports the state of any migration run started by this process.",
+    response_description="Migration status response with current and head revisions.",
+)
+async def migration_health_check(
+    request_id: str | None = Depends(get_request_id),
+) -> HealthResponse:
+    """
+    Migration health check endpoint.
+
+    Returns 'healthy' only when the database is at the head revision, and
+    'unhealthy' (with the error) if the current revision can't be read.
+    """
+    logger.info("Migration health check requested", extra={"request_id": request_id})
+    head_revision = migrations.get_head_revision()
+    try:
+        current_revision = await migrations.get_current_revision()
+    except Exception as e:
+        logger.error(
+            f"Migration health check could not read the current revision: {e}",
+            extra={"request_id": request_id},
+        )
+        return HealthResponse(
+            status="unhealthy",
+            timestamp=datetime.utcnow(),
+            version=settings.version,
+            checks={
+                "migration": HealthCheck(
+                    status="unhealthy",
+                    message=f"Could not read current revision: {e}",
+                ).model_dump(),
+            },
+        )
+    status_code = "healthy" if current_revision == head_revision else "unhealthy"
+
+    logger.info(
+        f"Migration health check completed: status={status_code}, "
+        f"current={current_revision}, head={head_revision}",
+        extra={"request_id": request_id, "migration_status": status_code},
+    )
+
+    return HealthResponse(
+        status=status_code,
+        timestamp=datetime.utcnow(),
+        version=settings.version,
+        checks={
+            "migration": HealthCheck(
+                status=status_code,
+                message=(
+                    f"Current revision {current_revision}, head revision {head_revision}, "
+                    f"run state {migrations.migration_state}"
+                ),
+            ).model_dump(),
+        },
+    )
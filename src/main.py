@@ -16,6 +16,7 @@ from src.config import settings
 from src.core.exception_handlers import register_exception_handlers
 from src.core.logging import setup_logging
 from src.core.middleware import RequestIDMiddleware
+from src.core.migrations import run_migrations
 from src.database import engine
 from src.evidence_submissions.admin_router import router as evidence_admin_router
 from src.evidence_submissions.router import router as evidence_submissions_router
@@ -38,6 +39,9 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     logger.info("Starting application")
+    if settings.migration_mode == "sync":
+        if await run_migrations() != 0:
+            raise RuntimeError("Database migrations failed")
     yield
     # Shutdown
     logger.info("Shutting down application")
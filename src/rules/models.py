@@ -133,7 +133,10 @@ class RuleEvidenceClaim(SQLModel, table=True):
     """Join between rules and evidence claims."""
 
     __tablename__ = "rule_evidence_claims"
-    __table_args__ = (PrimaryKeyConstraint("rule_id", "evidence_claim_id", name="pk_rule_claim"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("rule_id", "evidence_claim_id", name="pk_rule_claim"),
+        Index("idx_rule_evidence_claims_evidence_claim_id", "evidence_claim_id"),
+    )
 
     rule_id: UUID = Field(
         sa_column=Column(
@@ -17,7 +17,7 @@ class WaitlistEntry(SQLModel, table=True):
         default_factory=uuid4,
         sa_column=Column(PostgresUUID(as_uuid=True), primary_key=True),
     )
-    email: str = Field(max_length=255, index=True, unique=True)
+    email: str = Field(max_length=255, unique=True)
     name: str | None = Field(default=None, max_length=255)
     message: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
     created_at: datetime = Field(
@@ -0,0 +1,110 @@
+"""Tests for the admin dashboard cache: hits, expiry and invalidation on writes."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.admin import service
+from src.admin.service import get_cached_dashboard, invalidate_dashboard_cache
+from src.audit_workflows.models import AuditWorkflowStatus
+from src.audit_workflows.service import WorkflowSubmissionService
+
+
+@pytest.mark.asyncio
+async def test_cached_dashboard_is_reused_within_ttl(db_session: AsyncSession, seeder):
+    """A second call inside the TTL returns the cached dashboard without re-querying."""
+    first = await get_cached_dashboard(db_session)
+    brand = await seeder.brand()
+    await seeder.workflow(await seeder.audit(brand))
+
+    second = await get_cached_dashboard(db_session)
+
+    assert second is first
+    assert second.summary.total_completed_workflows == first.summary.total_completed_workflows
+
+
+@pytest.mark.asyncio
+async def test_cached_dashboard_is_rebuilt_after_ttl(db_session: AsyncSession, seeder, monkeypatch):
+    """Once the TTL has passed the dashboard is rebuilt and shows new rows."""
+    first = await get_cached_dashboard(db_session)
+    brand = await seeder.brand()
+    await seeder.workflow(await seeder.audit(brand))
+    monkeypatch.setattr(service, "DASHBOARD_CACHE_TTL_SECONDS", 0)
+
+    second = await get_cached_dashboard(db_session)
+
+    assert second is not first
+    assert second.summary.total_completed_workflows == first.summary.total_completed_workflows + 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_dashboard_cache_forces_rebuild(db_session: AsyncSession, seeder):
+    """invalidate_dashboard_cache() makes the next call rebuild."""
+    first = await get_cached_dashboard(db_session)
+    brand = await seeder.brand()
+    await seeder.workflow(await seeder.audit(brand))
+
+    invalidate_dashboard_cache()
+    second = await get_cached_dashboard(db_session)
+
+    assert second.summary.total_completed_workflows == first.summary.total_completed_workflows + 1
+
+
+@pytest.mark.asyncio
+async def test_workflow_status_write_invalidates_dashboard(db_session: AsyncSession, seeder):
+    """Moving a workflow to PROCESSING clears the cache, so the next dashboard shows it."""
+    brand = await seeder.brand()
+    workflow = await seeder.workflow(
+        await seeder.audit(brand), status=AuditWorkflowStatus.GENERATED
+    )
+    first = await get_cached_dashboard(db_session)
+
+    await WorkflowSubmissionService.update_workflow_status_to_processing(db_session, workflow.id)
+    second = await get_cached_dashboard(db_session)
+
+    assert second is not first
+    recent = {w.workflow_id: w for w in second.recent_workflows}
+    assert recent[str(workflow.id)].status == "Processing"
+
+
+@pytest.mark.asyncio
+async def test_dashboard_endpoint_serves_cached_response(
+    client: AsyncClient, admin_headers: dict, seeder
+):
+    """The endpoint keeps serving the cached figures until the cache is cleared."""
+    first = (await client.get("/api/v1/admin/dashboard", headers=admin_headers)).json()
+    brand = await seeder.brand()
+    await seeder.workflow(await seeder.audit(brand))
+
+    cached = (await client.get("/api/v1/admin/dashboard", headers=admin_headers)).json()
+    invalidate_dashboard_cache()
+    rebuilt = (await client.get("/api/v1/admin/dashboard", headers=admin_headers)).json()
+
+    assert cached == first
+    total = first["summary"]["totalCompletedWorkflows"]
+    assert rebuilt["summary"]["totalCompletedWorkflows"] == total + 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_rebuild_is_not_overwritten(
+    db_session: AsyncSession, seeder, monkeypatch
+):
+    """A write landing while the dashboard is being rebuilt isn't hidden by the stale rebuild."""
+    build_dashboard = service.build_dashboard
+    brand = await seeder.brand()
+
+    async def _build_then_write(db: AsyncSession):
+        dashboard = await build_dashboard(db)
+        # A workflow written (and the cache invalidated) after the rebuild queried
+        await seeder.workflow(await seeder.audit(brand))
+        invalidate_dashboard_cache()
+        return dashboard
+
+    monkeypatch.setattr(service, "build_dashboard", _build_then_write)
+    stale = await get_cached_dashboard(db_session)
+    monkeypatch.setattr(service, "build_dashboard", build_dashboard)
+
+    fresh = await get_cached_dashboard(db_session)
+
+    assert fresh is not stale
+    assert fresh.summary.total_completed_workflows == stale.summary.total_completed_workflows + 1
@@ -0,0 +1,126 @@
+"""Tests for the admin dashboard service (get_dashboard_data) against seeded rows."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.admin.service import _extract_product_info, get_dashboard_data
+from src.audit_workflows.models import AuditWorkflowStatus
+
+
+@pytest.mark.parametrize(
+    ("product_info", "expected"),
+    [
+        ({"productName": "Shirt", "targetMarket": "EU"}, ("Shirt", "EU")),
+        ({"productName": "", "targetMarket": None}, (None, None)),
+        ({"productName": False, "targetMarket": 0}, (None, None)),
+        ({"productName": 42, "targetMarket": True}, ("42", "True")),
+        ({}, (None, None)),
+        ("not an object", (None, None)),
+        (None, (None, None)),
+    ],
+)
+def test_extract_product_info(product_info, expected):
+    """Falsy values are missing; other values are converted with str()."""
+    assert _extract_product_info(product_info) == expected
+
+
+@pytest.mark.asyncio
+async def test_recent_workflows_read_product_info(db_session: AsyncSession, seeder):
+    """Recent workflows carry productName/targetMarket from the audit's productInfo."""
+    brand = await seeder.brand()
+    named = await seeder.audit(
+        brand, {"productInfo": {"productName": "Shirt", "targetMarket": "EU"}}
+    )
+    unnamed = await seeder.audit(brand, {"productInfo": {"productName": False}})
+    now = datetime.now(UTC)
+    named_wf = await seeder.workflow(named, updated_at=now)
+    unnamed_wf = await seeder.workflow(unnamed, updated_at=now)
+
+    data = await get_dashboard_data(db_session)
+
+    recent = {w["workflow_id"]: w for w in data["recent_workflows"]}
+    assert recent[str(named_wf.id)]["product_name"] == "Shirt"
+    assert recent[str(named_wf.id)]["target_market"] == "EU"
+    assert recent[str(unnamed_wf.id)]["product_name"] is None
+    assert recent[str(unnamed_wf.id)]["target_market"] is None
+
+
+def _today(data: dict) -> dict:
+    today = datetime.now(UTC).date().isoformat()
+    return next(d for d in data["workflows_completed_over_time"] if d["date"] == today)
+
+
+@pytest.mark.asyncio
+async def test_dashboard_aggregate_counts(db_session: AsyncSession, seeder):
+    """
+    Summary, certification breakdown and per-day counts move by exactly the seeded rows.
+
+    Counted as deltas so rows already in the database don't matter.
+    """
+    before = await get_dashboard_data(db_session)
+    now = datetime.now(UTC)
+
+    brand = await seeder.brand()
+    audit = await seeder.audit(brand)
+    await seeder.workflow(audit, certification="Gold", updated_at=now)
+    await seeder.workflow(audit, certification="Silver", updated_at=now)
+    await seeder.workflow(audit, updated_at=now)
+    await seeder.workflow(audit, certification="Bronze", updated_at=now - timedelta(days=40))
+    # Not completed: counted nowhere except recent workflows
+    await seeder.workflow(audit, status=AuditWorkflowStatus.GENERATED, certification="Gold")
+    # A brand with an audit but no workflows is still an active client
+    await seeder.audit(await seeder.brand())
+    # A deleted brand isn't
+    await seeder.audit(await seeder.brand(deleted_at=now))
+
+    after = await get_dashboard_data(db_session)
+
+    summary_before, summary_after = before["summary"], after["summary"]
+    assert summary_after["active_clients"] - summary_before["active_clients"] == 2
+    assert (
+        summary_after["total_completed_workflows"] - summary_before["total_completed_workflows"]
+        == 4
+    )
+    assert summary_after["audits_in_last_30_days"] - summary_before["audits_in_last_30_days"] == 3
+
+    breakdown_before, breakdown_after = (
+        before["certification_breakdown"],
+        after["certification_breakdown"],
+    )
+    assert {
+        level: breakdown_after[level] - breakdown_before[level] for level in breakdown_after
+    } == {
+        "bronze": 1,
+        "silver": 1,
+        "gold": 1,
+    }
+
+    assert _today(after)["completed"] - _today(before)["completed"] == 3
+    assert _today(after)["passed"] - _today(before)["passed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_dashboard_pass_rate_matches_counts(db_session: AsyncSession, seeder):
+    """The pass rate is the certified share of completed workflows, rounded down."""
+    brand = await seeder.brand()
+    audit = await seeder.audit(brand)
+    await seeder.workflow(audit, certification="Gold")
+    await seeder.workflow(audit)
+
+    data = await get_dashboard_data(db_session)
+
+    total = data["summary"]["total_completed_workflows"]
+    certified = sum(data["certification_breakdown"].values())
+    assert data["summary"]["pass_rate"] == certified * 100 // total
+
+
+@pytest.mark.asyncio
+async def test_dashboard_fills_every_day(db_session: AsyncSession):
+    """The per-day series covers the last 31 days, oldest first, with no gaps."""
+    data = await get_dashboard_data(db_session)
+
+    days = [item["date"] for item in data["workflows_completed_over_time"]]
+    today = datetime.now(UTC).date()
+    assert days == [(today - timedelta(days=30 - i)).isoformat() for i in range(31)]
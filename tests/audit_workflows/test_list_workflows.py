@@ -0,0 +1,59 @@
+"""Tests for GET /api/v1/audits/{audit_id}/workflows."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.audit_workflows.router import _WORKFLOW_SUMMARIES_ADAPTER
+from src.audit_workflows.schemas import WorkflowSummary
+
+
+@pytest.mark.asyncio
+async def test_list_workflows_returns_validated_page(
+    client: AsyncClient, admin_headers: dict, db_session: AsyncSession, seeder
+):
+    """The page is newest first, camelCase, and per-field validators still run."""
+    brand = await seeder.brand()
+    audit = await seeder.audit(brand)
+    older = await seeder.workflow(audit, certification="Gold")
+    newer = await seeder.workflow(audit)
+    older.created_at = datetime.now(UTC) - timedelta(hours=1)
+    older.overall_score = 95
+    # Legacy out-of-range score: the summary validator turns it into null
+    newer.overall_score = 10000
+    await db_session.commit()
+
+    response = await client.get(
+        f"/api/v1/audits/{audit.id}/workflows", params={"limit": 1}, headers=admin_headers
+    )
+    next_page = await client.get(
+        f"/api/v1/audits/{audit.id}/workflows",
+        params={"limit": 1, "offset": 1},
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 2
+    assert [item["id"] for item in body["items"]] == [str(newer.id)]
+    assert body["items"][0]["auditId"] == str(audit.id)
+    assert body["items"][0]["overallScore"] is None
+    assert [item["overallScore"] for item in next_page.json()["items"]] == [95]
+    assert next_page.json()["items"][0]["certification"] == "Gold"
+
+
+@pytest.mark.asyncio
+async def test_workflow_summaries_adapter_matches_model_validate(db_session: AsyncSession, seeder):
+    """Validating the list in one call gives the same items as validating each row."""
+    brand = await seeder.brand()
+    audit = await seeder.audit(brand)
+    workflows = [
+        await seeder.workflow(audit, certification="Silver"),
+        await seeder.workflow(audit),
+    ]
+
+    assert _WORKFLOW_SUMMARIES_ADAPTER.validate_python(workflows, from_attributes=True) == [
+        WorkflowSummary.model_validate(w, from_attributes=True) for w in workflows
+    ]
@@ -0,0 +1,102 @@
+"""Tests that the audit_workflows table matches its model."""
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.audit_workflows.models import AuditWorkflow, AuditWorkflowStatus
+from src.database import AsyncSessionLocal
+
+
+@pytest.mark.asyncio
+async def test_workflow_status_enum_matches_model(db_session: AsyncSession):
+    """audit_workflows.status is the audit_workflow_status enum, with the model's values."""
+    labels = (
+        (
+            await db_session.execute(
+                text("SELECT unnest(enum_range(NULL::audit_workflow_status))::text")
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    assert labels == [
+        AuditWorkflowStatus.GENERATED,
+        AuditWorkflowStatus.PROCESSING,
+        AuditWorkflowStatus.PROCESSING_COMPLETE,
+        AuditWorkflowStatus.PROCESSING_FAILED,
+    ]
+    assert list(AuditWorkflow.__table__.c.status.type.enums) == labels
+
+
+@pytest.mark.asyncio
+async def test_workflow_status_rejects_unknown_value(seeder):
+    """The enum rejects statuses the application doesn't define."""
+    workflow = await seeder.workflow(await seeder.audit(await seeder.brand()))
+    async with AsyncSessionLocal() as session:
+        with pytest.raises(DBAPIError):
+            await session.execute(
+                text("UPDATE audit_workflows SET status = 'STALE' WHERE id = :id"),
+                {"id": workflow.id},
+            )
+
+
+@pytest.mark.asyncio
+async def test_workflow_status_filters_with_plain_strings(db_session: AsyncSession, seeder):
+    """ORM filters compare the enum column with the string constants the services use."""
+    audit = await seeder.audit(await seeder.brand())
+    generated = await seeder.workflow(audit, status=AuditWorkflowStatus.GENERATED)
+    failed = await seeder.workflow(audit, status=AuditWorkflowStatus.PROCESSING_FAILED)
+    await seeder.workflow(audit)
+
+    result = await db_session.execute(
+        select(AuditWorkflow.id, AuditWorkflow.status).where(
+            AuditWorkflow.audit_id == audit.id,
+            AuditWorkflow.status.in_(
+                [AuditWorkflowStatus.GENERATED, AuditWorkflowStatus.PROCESSING_FAILED]
+            ),
+        )
+    )
+
+    assert dict(result.all()) == {
+        generated.id: AuditWorkflowStatus.GENERATED,
+        failed.id: AuditWorkflowStatus.PROCESSING_FAILED,
+    }
+
+
+@pytest.mark.asyncio
+async def test_dashboard_indexes_match_model(index_definition):
+    """The dashboard indexes exist as the model declares them."""
+    completed = await index_definition(AuditWorkflow, "idx_audit_workflows_completed_updated_at")
+    recent = await index_definition(AuditWorkflow, "idx_audit_workflows_recent")
+
+    assert completed.endswith(
+        "USING btree (updated_at) INCLUDE (certification) "
+        "WHERE (status = 'PROCESSING_COMPLETE'::audit_workflow_status)"
+    )
+    assert recent.endswith("USING btree (updated_at DESC NULLS LAST, created_at DESC)")
+
+
+@pytest.mark.asyncio
+async def test_completed_counts_can_use_partial_index(explain):
+    """Counting completed workflows by updated_at can be served by the partial index."""
+    plan = await explain(
+        "SELECT count(*) FILTER (WHERE certification = 'Gold') FROM audit_workflows "
+        "WHERE status = 'PROCESSING_COMPLETE' AND updated_at >= now() - interval '30 days'"
+    )
+
+    assert "idx_audit_workflows_completed_updated_at" in plan
+
+
+@pytest.mark.asyncio
+async def test_recent_workflows_can_use_ordered_index(explain):
+    """The recent workflows query can walk the ordered index instead of sorting."""
+    plan = await explain(
+        "SELECT id FROM audit_workflows "
+        "ORDER BY updated_at DESC NULLS LAST, created_at DESC LIMIT 10"
+    )
+
+    assert "idx_audit_workflows_recent" in plan
+    assert "Sort" not in plan
@@ -0,0 +1,67 @@
+"""Tests for the audit workflow response schemas."""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.audit_workflows.models import AuditWorkflow
+from src.audit_workflows.schemas import WorkflowResponse, WorkflowSummary
+from src.audit_workflows.service import WorkflowSubmissionService
+
+_VALIDATED_SCORES = TypeAdapter(dict | None)
+
+
+def _workflow_response(category_scores) -> WorkflowResponse:
+    return WorkflowResponse(
+        id=uuid4(),
+        audit_id=uuid4(),
+        status="PROCESSING_COMPLETE",
+        engine_version="1",
+        category_scores=category_scores,
+        claims=[],
+        created_at=datetime(2026, 1, 1),
+        updated_at=datetime(2026, 1, 1),
+    )
+
+
+@pytest.mark.asyncio
+async def test_stored_category_scores_serialize_as_validated(db_session: AsyncSession, seeder):
+    """
+    category_scores skips validation; this shows the skip is safe.
+
+    The JSONB written by the scoring service, read back from the database, serializes
+    exactly as it would through a validated dict field.
+    """
+    brand = await seeder.brand()
+    workflow = await seeder.workflow(await seeder.audit(brand))
+    _, category_scores, _, _ = await WorkflowSubmissionService._calculate_workflow_scores(
+        db_session, workflow.id, []
+    )
+    workflow.category_scores = category_scores
+    await db_session.commit()
+    db_session.expunge_all()
+
+    stored = (await db_session.get(AuditWorkflow, workflow.id)).category_scores
+    response = _workflow_response(stored)
+
+    assert isinstance(stored, dict)
+    assert response.category_scores is stored
+    assert response.model_dump(mode="json", by_alias=True)["categoryScores"] == (
+        _VALIDATED_SCORES.dump_python(_VALIDATED_SCORES.validate_python(stored), mode="json")
+    )
+
+
+@pytest.mark.parametrize("model", [WorkflowResponse, WorkflowSummary])
+def test_category_scores_schema_is_unchanged(model):
+    """Skipping validation doesn't change the published schema of the field."""
+    schema = model.model_json_schema(by_alias=True)["properties"]["categoryScores"]
+
+    assert schema["anyOf"] == [{"additionalProperties": True, "type": "object"}, {"type": "null"}]
+
+
+def test_missing_category_scores_serialize_as_null():
+    """Workflows that were never scored return null."""
+    assert _workflow_response(None).model_dump(by_alias=True)["categoryScores"] is None
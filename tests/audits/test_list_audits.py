@@ -0,0 +1,54 @@
+"""Tests for GET /api/v1/audits filter validation."""
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("params", "detail"),
+    [
+        ({"status": "ARCHIVED"}, "Invalid status: ARCHIVED. Must be 'DRAFT' or 'PUBLISHED'"),
+        ({"status": "draft"}, "Invalid status: draft. Must be 'DRAFT' or 'PUBLISHED'"),
+        (
+            {"scope": "Everything"},
+            "Invalid scope: Everything. Must be 'Single Product', 'Collection', or 'Brand-wide'",
+        ),
+        ({"brand_id": "not-a-uuid"}, "Invalid brand_id: not-a-uuid. Must be a UUID"),
+    ],
+)
+async def test_list_audits_rejects_invalid_filters(
+    client: AsyncClient, admin_headers: dict, params: dict, detail: str
+):
+    """Invalid filter values are a 400 with the documented message."""
+    response = await client.get("/api/v1/audits", params=params, headers=admin_headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == detail
+
+
+@pytest.mark.asyncio
+async def test_list_audits_applies_valid_filters(client: AsyncClient, admin_headers: dict, seeder):
+    """Valid brand_id, status and scope values filter the list."""
+    brand = await seeder.brand()
+    audit = await seeder.audit(brand, {"productInfo": {"auditScope": "Collection"}})
+    await seeder.audit(brand, {"productInfo": {"auditScope": "Single Product"}})
+
+    response = await client.get(
+        "/api/v1/audits",
+        params={"brand_id": str(brand.id), "status": "DRAFT", "scope": "Collection"},
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 1
+    assert [item["id"] for item in body["items"]] == [str(audit.id)]
+
+
+@pytest.mark.asyncio
+async def test_list_audits_without_filters(client: AsyncClient, admin_headers: dict):
+    """No filters is a valid request."""
+    response = await client.get("/api/v1/audits", headers=admin_headers)
+
+    assert response.status_code == 200
@@ -0,0 +1,73 @@
+"""Tests that the audits table matches its model."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.audits.models import Audit, AuditStatus
+from src.database import AsyncSessionLocal
+
+
+def _model_index(name: str):
+    return next(index for index in Audit.__table__.indexes if index.name == name)
+
+
+@pytest.mark.asyncio
+async def test_audit_data_gin_index_has_fastupdate_off(db_session: AsyncSession):
+    """The audit_data GIN index writes entries directly, in the database and the model."""
+    reloptions = await db_session.scalar(
+        text("SELECT reloptions FROM pg_class WHERE relname = 'idx_audits_audit_data_gin'")
+    )
+    index = _model_index("idx_audits_audit_data_gin")
+
+    assert reloptions == ["fastupdate=off"]
+    assert index.dialect_options["postgresql"]["with"] == {"fastupdate": "off"}
+    assert index.dialect_options["postgresql"]["ops"] == {"audit_data": "jsonb_path_ops"}
+
+
+@pytest.mark.asyncio
+async def test_audit_status_enum_matches_model(db_session: AsyncSession):
+    """audits.status is the audit_status enum, with the model's values in order."""
+    labels = (
+        (await db_session.execute(text("SELECT unnest(enum_range(NULL::audit_status))::text")))
+        .scalars()
+        .all()
+    )
+    column_type = await db_session.scalar(
+        text(
+            "SELECT udt_name FROM information_schema.columns "
+            "WHERE table_name = 'audits' AND column_name = 'status'"
+        )
+    )
+
+    assert column_type == "audit_status"
+    assert labels == [AuditStatus.DRAFT, AuditStatus.PUBLISHED]
+    assert list(Audit.__table__.c.status.type.enums) == labels
+
+
+@pytest.mark.asyncio
+async def test_audit_status_defaults_to_draft(seeder):
+    """An audit inserted without a status is a DRAFT."""
+    brand = await seeder.brand()
+    # Separate session, never committed: the insert is rolled back on close
+    async with AsyncSessionLocal() as session:
+        status = await session.scalar(
+            text(
+                "INSERT INTO audits (brand_id, audit_data) VALUES (:brand_id, '{}') RETURNING status"
+            ),
+            {"brand_id": brand.id},
+        )
+
+    assert status == AuditStatus.DRAFT
+
+
+@pytest.mark.asyncio
+async def test_audit_status_rejects_unknown_value(seeder):
+    """The enum rejects statuses outside DRAFT and PUBLISHED."""
+    audit = await seeder.audit(await seeder.brand())
+    async with AsyncSessionLocal() as session:
+        with pytest.raises(DBAPIError):
+            await session.execute(
+                text("UPDATE audits SET status = 'ARCHIVED' WHERE id = :id"), {"id": audit.id}
+            )
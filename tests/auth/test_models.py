@@ -0,0 +1,34 @@
+"""Tests that the user_profiles table matches its model."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.models import UserProfile
+
+
+@pytest.mark.asyncio
+async def test_last_access_at_index_skips_nulls(db_session: AsyncSession, index_definition):
+    """Profiles that never logged in aren't in the last_access_at index."""
+    definition = await index_definition(UserProfile, "idx_user_profiles_last_access_at")
+    names = set(
+        (
+            await db_session.execute(
+                text("SELECT indexname FROM pg_indexes WHERE tablename = 'user_profiles'")
+            )
+        ).scalars()
+    )
+
+    assert definition.endswith("USING btree (last_access_at) WHERE (last_access_at IS NOT NULL)")
+    assert "idx_user_profiles_is_active" not in names
+
+
+@pytest.mark.asyncio
+async def test_recent_access_query_can_use_partial_index(explain):
+    """Ordering profiles by last access can be served by the partial index."""
+    plan = await explain(
+        "SELECT id FROM user_profiles WHERE last_access_at IS NOT NULL "
+        "ORDER BY last_access_at DESC LIMIT 20"
+    )
+
+    assert "idx_user_profiles_last_access_at" in plan
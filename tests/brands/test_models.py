@@ -0,0 +1,37 @@
+"""Tests that the brands table matches its model."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.brands.models import Brand
+
+
+@pytest.mark.asyncio
+async def test_live_brands_index_is_partial(db_session: AsyncSession, index_definition):
+    """Only live brands are indexed by created_at; the full deleted_at/created_at indexes are gone."""
+    definition = await index_definition(Brand, "idx_brands_live_created_at")
+    names = set(
+        (
+            await db_session.execute(
+                text("SELECT indexname FROM pg_indexes WHERE tablename = 'brands'")
+            )
+        ).scalars()
+    )
+
+    assert definition.endswith("USING btree (created_at) WHERE (deleted_at IS NULL)")
+    assert "idx_brands_deleted_at" not in names
+    assert "idx_brands_created_at" not in names
+
+
+@pytest.mark.asyncio
+async def test_brand_list_can_use_live_index(explain):
+    """Listing live brands newest first can walk the partial index without sorting."""
+    # Bitmap scans are ruled out too: they can't return rows in index order
+    plan = await explain(
+        "SELECT id FROM brands WHERE deleted_at IS NULL ORDER BY created_at DESC LIMIT 20",
+        disable=("seqscan", "bitmapscan"),
+    )
+
+    assert "idx_brands_live_created_at" in plan
+    assert "Sort" not in plan
@@ -1,17 +1,27 @@
 """Pytest fixtures for integration tests."""
 
-from typing import Annotated
-from uuid import uuid4
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from datetime import datetime
+from typing import Annotated, Any
+from uuid import UUID, uuid4
 
 import pytest
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, text
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateIndex
+from sqlmodel import SQLModel
 
+from src.admin.service import invalidate_dashboard_cache
+from src.audit_workflows.models import AuditWorkflow, AuditWorkflowStatus
+from src.audits.models import Audit
 from src.auth.dependencies import get_current_user, UserContext
 from src.auth.models import UserProfile
-from src.database import get_db
+from src.brands.models import Brand
+from src.database import AsyncSessionLocal, get_db
 from src.main import app
 
 _security = HTTPBearer()
@@ -35,6 +45,14 @@ def app_with_auth_override():
     app.dependency_overrides.pop(get_current_user, None)
 
 
+@pytest.fixture(autouse=True)
+def reset_dashboard_cache():
+    """Start and end every test without a cached admin dashboard."""
+    invalidate_dashboard_cache()
+    yield
+    invalidate_dashboard_cache()
+
+
 @pytest.fixture
 async def client(app_with_auth_override):
     """Async HTTP client for the FastAPI app (with auth override)."""
@@ -62,3 +80,127 @@ def admin_headers():
 def non_admin_headers():
     """Headers for non-admin user (admin dashboard 403)."""
     return {"Authorization": "Bearer user"}
+
+
+@pytest.fixture
+async def db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Database session for seeding and inspecting rows directly."""
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+class Seeder:
+    """Inserts brands, audits and workflows for a test and deletes them afterwards."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        # IDs rather than instances: a rollback expires instances, and reloading them in
+        # cleanup() would need a lazy load the async session can't do
+        self.brand_ids: list[UUID] = []
+        self.audit_ids: list[UUID] = []
+        self.workflow_ids: list[UUID] = []
+
+    async def brand(self, **fields: Any) -> Brand:
+        """Insert a brand (an SME registered in DE unless overridden)."""
+        brand = Brand(
+            **{"name": "Test Brand", "registration_country": "DE", "company_size": "SME", **fields}
+        )
+        self.session.add(brand)
+        await self.session.commit()
+        self.brand_ids.append(brand.id)
+        return brand
+
+    async def audit(self, brand: Brand, audit_data: dict[str, Any] | None = None) -> Audit:
+        """Insert an audit for brand."""
+        audit = Audit(brand_id=brand.id, audit_data=audit_data or {})
+        self.session.add(audit)
+        await self.session.commit()
+        self.audit_ids.append(audit.id)
+        return audit
+
+    async def workflow(
+        self,
+        audit: Audit,
+        status: str = AuditWorkflowStatus.PROCESSING_COMPLETE,
+        certification: str | None = None,
+        updated_at: datetime | None = None,
+    ) -> AuditWorkflow:
+        """Insert a workflow for audit."""
+        workflow = AuditWorkflow(
+            audit_id=audit.id, status=status, certification=certification, updated_at=updated_at
+        )
+        self.session.add(workflow)
+        await self.session.commit()
+        self.workflow_ids.append(workflow.id)
+        return workflow
+
+    async def cleanup(self) -> None:
+        """Delete everything this seeder inserted, children first."""
+        # A failing test can leave the session mid-transaction
+        await self.session.rollback()
+        for model, ids in (
+            (AuditWorkflow, self.workflow_ids),
+            (Audit, self.audit_ids),
+            (Brand, self.brand_ids),
+        ):
+            if ids:
+                await self.session.execute(delete(model).where(model.id.in_(ids)))
+        await self.session.commit()
+
+
+@pytest.fixture
+async def seeder(db_session: AsyncSession) -> AsyncGenerator[Seeder, None]:
+    """Seeder whose rows are removed when the test finishes."""
+    seeder = Seeder(db_session)
+    try:
+        yield seeder
+    finally:
+        await seeder.cleanup()
+
+
+@pytest.fixture
+def index_definition() -> Callable[[type[SQLModel], str], Awaitable[str]]:
+    """Return an async lookup of an index's definition, checked against its model.
+
+    The model's CREATE INDEX is built under a scratch name in a rolled-back transaction, so
+    Postgres normalizes both versions the same way; the catalog definition left by the
+    migrations must then match it exactly. Returns the catalog definition (``pg_indexes.indexdef``)
+    for any table-specific assertions.
+    """
+
+    async def _index_definition(model: type[SQLModel], name: str) -> str:
+        index = next(index for index in model.__table__.indexes if index.name == name)
+        scratch = f"{name}_model"
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+        lookup = "SELECT indexdef FROM pg_indexes WHERE indexname = $1"
+        async with AsyncSessionLocal() as session:
+            connection = await session.connection()
+            definition = await connection.exec_driver_sql(lookup, (name,))
+            catalog = definition.scalar_one_or_none()
+            await connection.exec_driver_sql(ddl.replace(f"INDEX {name} ", f"INDEX {scratch} ", 1))
+            built = (await connection.exec_driver_sql(lookup, (scratch,))).scalar_one()
+            await session.rollback()
+
+        assert catalog == built.replace(scratch, name)
+        return catalog
+
+    return _index_definition
+
+
+@pytest.fixture
+def explain() -> Callable[..., Awaitable[str]]:
+    """Return an async EXPLAIN of a query with the given planner methods switched off.
+
+    Switching off seq (and bitmap) scans only shows that an index *can* serve the query and
+    in what order; on tiny test tables the planner would rightly prefer a scan, so this says
+    nothing about which plan production picks.
+    """
+
+    async def _explain(sql: str, disable: tuple[str, ...] = ("seqscan",)) -> str:
+        async with AsyncSessionLocal() as session:
+            for method in disable:
+                await session.execute(text(f"SET LOCAL enable_{method} = off"))
+            rows = (await session.execute(text(f"EXPLAIN {sql}"))).scalars().all()
+        return "\n".join(rows)
+
+    return _explain
@@ -0,0 +1,117 @@
+"""Tests for UUIDv7 generation in Python and in the database default."""
+
+import time
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import ids
+from src.core.ids import uuid7
+
+
+def _timestamp_ms(value: uuid.UUID) -> int:
+    return value.int >> 80
+
+
+@pytest.fixture
+def fresh_generator(monkeypatch):
+    """Start from a generator that hasn't issued an ID yet."""
+    monkeypatch.setattr(ids, "_last_timestamp_ms", 0)
+    monkeypatch.setattr(ids, "_last_rand", 0)
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """A clock whose nanosecond time the test sets explicitly."""
+    clock = {"ns": 1_760_000_000_000 * 1_000_000}
+    monkeypatch.setattr(ids.time, "time_ns", lambda: clock["ns"])
+    return clock
+
+
+def test_uuid7_version_and_variant():
+    """Every ID is version 7 with the RFC 9562 variant."""
+    for _ in range(1000):
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_timestamp_is_unix_milliseconds():
+    """The leading 48 bits are the current Unix time in milliseconds."""
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert before <= _timestamp_ms(value) <= after
+
+
+def test_uuid7_monotonic_within_millisecond(fresh_generator, frozen_clock):
+    """IDs generated in the same millisecond are strictly increasing."""
+    values = [uuid7() for _ in range(1000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    assert {_timestamp_ms(v) for v in values} == {frozen_clock["ns"] // 1_000_000}
+
+
+def test_uuid7_monotonic_across_milliseconds(fresh_generator, frozen_clock):
+    """A later millisecond always sorts after an earlier one."""
+    values = []
+    for _ in range(100):
+        values.extend(uuid7() for _ in range(5))
+        frozen_clock["ns"] += 1_000_000
+
+    assert values == sorted(values)
+    assert len({_timestamp_ms(v) for v in values}) == 100
+
+
+def test_uuid7_monotonic_when_clock_steps_back(fresh_generator, frozen_clock):
+    """A clock stepping backwards doesn't produce a smaller ID."""
+    first = uuid7()
+    frozen_clock["ns"] -= 5_000_000
+    second = uuid7()
+
+    assert second > first
+    assert _timestamp_ms(second) == _timestamp_ms(first)
+
+
+def test_uuid7_counter_overflow_advances_timestamp(fresh_generator, frozen_clock, monkeypatch):
+    """Exhausting the random bits within a millisecond moves on to the next one."""
+    first = uuid7()
+    monkeypatch.setattr(ids, "_last_rand", (1 << 74) - 1)
+    second = uuid7()
+
+    assert second > first
+    assert _timestamp_ms(second) == _timestamp_ms(first) + 1
+    assert second.version == 7
+    assert second.variant == uuid.RFC_4122
+
+
+def test_uuid7_unique():
+    """IDs don't repeat."""
+    values = [uuid7() for _ in range(100_000)]
+
+    assert len(set(values)) == len(values)
+
+
+@pytest.mark.asyncio
+async def test_sql_uuid_generate_v7_matches_python_layout(db_session: AsyncSession):
+    """uuid_generate_v7() in the database produces the same layout as uuid7()."""
+    before = uuid7()
+    time.sleep(0.002)
+    rows = (
+        (await db_session.execute(text("SELECT uuid_generate_v7() FROM generate_series(1, 100)")))
+        .scalars()
+        .all()
+    )
+    time.sleep(0.002)
+    after = uuid7()
+
+    for value in rows:
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+        assert _timestamp_ms(before) <= _timestamp_ms(value) <= _timestamp_ms(after)
+        # Keys from either source interleave by creation time
+        assert before < value < after
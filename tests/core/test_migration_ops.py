@@ -0,0 +1,151 @@
+"""Tests for the Alembic revision helpers."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import NullPool, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.config import settings
+from src.core.migration_ops import (
+    concurrent_index_block,
+    drop_invalid_index,
+    require_valid_index,
+)
+
+SCRATCH_TABLE = "migration_ops_scratch"
+
+
+async def _run_ops(fn: Callable[[Connection], Any]) -> Any:
+    """Run fn with ``op`` bound to a migration context, on a session set up like env.py's."""
+    engine = create_async_engine(settings.database_url, poolclass=NullPool)
+    try:
+        async with engine.connect() as connection:
+            await connection.exec_driver_sql(
+                f"SET lock_timeout = '{settings.migration_lock_timeout}'"
+            )
+            await connection.commit()
+
+            def _run(sync_connection: Connection) -> Any:
+                with Operations.context(MigrationContext.configure(sync_connection)):
+                    return fn(sync_connection)
+
+            return await connection.run_sync(_run)
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+async def scratch_table():
+    """A throwaway table to build indexes on."""
+    engine = create_async_engine(settings.database_url, poolclass=NullPool)
+    async with engine.begin() as connection:
+        await connection.execute(text(f"CREATE TABLE {SCRATCH_TABLE} (value int)"))
+        await connection.execute(text(f"INSERT INTO {SCRATCH_TABLE} VALUES (1), (2), (3)"))
+    yield SCRATCH_TABLE
+    async with engine.begin() as connection:
+        await connection.execute(text(f"DROP TABLE IF EXISTS {SCRATCH_TABLE}"))
+    await engine.dispose()
+
+
+def _index_valid(connection: Connection, name: str) -> bool | None:
+    return connection.execute(
+        text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": name},
+    ).scalar_one_or_none()
+
+
+def _lock_timeout(connection: Connection) -> str:
+    return connection.exec_driver_sql("SHOW lock_timeout").scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_index_block_lifts_lock_timeout(monkeypatch):
+    """lock_timeout is off inside the block and back to the migration setting after it."""
+    monkeypatch.setattr(settings, "migration_lock_timeout", "2s")
+
+    def _fn(connection: Connection) -> tuple[str, str]:
+        with concurrent_index_block():
+            inside = _lock_timeout(connection)
+        return inside, _lock_timeout(connection)
+
+    assert await _run_ops(_fn) == ("0", "2s")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_build_outlasts_lock_timeout(monkeypatch, scratch_table):
+    """A build waiting on an open transaction longer than lock_timeout still ends up valid."""
+    monkeypatch.setattr(settings, "migration_lock_timeout", "200ms")
+    engine = create_async_engine(settings.database_url, poolclass=NullPool)
+
+    def _build(connection: Connection) -> None:
+        with concurrent_index_block():
+            connection.exec_driver_sql(
+                f"CREATE INDEX CONCURRENTLY idx_{scratch_table}_value ON {scratch_table} (value)"
+            )
+
+    try:
+        async with engine.connect() as reader:
+            # An open snapshot the concurrent build has to wait out
+            await reader.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ"))
+            await reader.execute(text("SELECT 1"))
+            build = asyncio.create_task(_run_ops(_build))
+            await asyncio.sleep(1)
+            assert not build.done()
+            await reader.rollback()
+            await build
+
+        async with engine.connect() as connection:
+            valid = await connection.scalar(
+                text(
+                    "SELECT indisvalid FROM pg_index "
+                    f"WHERE indexrelid = to_regclass('idx_{scratch_table}_value')"
+                )
+            )
+        assert valid is True
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_drop_invalid_index_lets_a_failed_build_be_retried(scratch_table):
+    """An INVALID index left by a failed build is dropped, so the retry builds a valid one."""
+    name = f"idx_{scratch_table}_value_unique"
+    create = f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {scratch_table} (value)"
+
+    def _fn(connection: Connection) -> list[bool | None]:
+        seen = []
+        with concurrent_index_block():
+            connection.exec_driver_sql(f"INSERT INTO {scratch_table} VALUES (1)")
+            with pytest.raises(IntegrityError, match="could not create unique index"):
+                connection.exec_driver_sql(create)
+            seen.append(_index_valid(connection, name))
+            with pytest.raises(RuntimeError, match="INVALID"):
+                require_valid_index(name)
+
+            connection.exec_driver_sql(f"DELETE FROM {scratch_table} WHERE value = 1")
+            drop_invalid_index(name)
+            seen.append(_index_valid(connection, name))
+            connection.exec_driver_sql(create)
+            require_valid_index(name)
+            seen.append(_index_valid(connection, name))
+        return seen
+
+    assert await _run_ops(_fn) == [False, None, True]
+
+
+@pytest.mark.asyncio
+async def test_require_valid_index_rejects_missing_index():
+    """Swapping in an index that was never built fails instead of dropping the old one."""
+
+    def _fn(connection: Connection) -> None:
+        with pytest.raises(RuntimeError, match="missing"):
+            require_valid_index("idx_migration_ops_never_built")
+
+    await _run_ops(_fn)
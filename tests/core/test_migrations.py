@@ -0,0 +1,145 @@
+"""Tests for the migration runner, startup migration modes and revision helpers."""
+
+import pytest
+from alembic.script import ScriptDirectory
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import src.main
+from src.config import Settings, settings
+from src.core import migrations
+from src.core.migrations import MigrationState
+
+
+@pytest.fixture
+def fresh_migration_state(monkeypatch):
+    """Run each test from NOT_STARTED and restore the module state afterwards."""
+    monkeypatch.setattr(migrations, "migration_state", MigrationState.NOT_STARTED)
+
+
+@pytest.fixture
+async def session_factory_for():
+    """Build session factories on throwaway engines and dispose them after the test."""
+    engines = []
+
+    def _factory(url: str, **connect_args):
+        engine = create_async_engine(url, connect_args=connect_args)
+        engines.append(engine)
+        return async_sessionmaker(engine, class_=AsyncSession)
+
+    yield _factory
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_run_migrations_succeeds_at_head(fresh_migration_state):
+    """Upgrading an up-to-date database exits 0 and records success."""
+    assert await migrations.run_migrations() == 0
+    assert migrations.migration_state == MigrationState.SUCCEEDED
+
+
+@pytest.mark.asyncio
+async def test_run_migrations_reports_failure(fresh_migration_state):
+    """An unknown target revision makes alembic fail and is recorded as FAILED."""
+    assert await migrations.run_migrations("ffffffffffff") != 0
+    assert migrations.migration_state == MigrationState.FAILED
+
+
+@pytest.mark.asyncio
+async def test_sync_mode_runs_migrations_before_serving(monkeypatch):
+    """MIGRATION_MODE=sync runs the migrations during startup."""
+    calls = []
+
+    async def _run_migrations():
+        calls.append("run")
+        return 0
+
+    monkeypatch.setattr(settings, "migration_mode", "sync")
+    monkeypatch.setattr(src.main, "run_migrations", _run_migrations)
+
+    async with src.main.lifespan(src.main.app):
+        assert calls == ["run"]
+
+
+@pytest.mark.asyncio
+async def test_sync_mode_fails_startup_when_migrations_fail(monkeypatch):
+    """A failed migration run in sync mode stops the application from starting."""
+
+    async def _run_migrations():
+        return 1
+
+    monkeypatch.setattr(settings, "migration_mode", "sync")
+    monkeypatch.setattr(src.main, "run_migrations", _run_migrations)
+
+    with pytest.raises(RuntimeError, match="Database migrations failed"):
+        async with src.main.lifespan(src.main.app):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_skip_mode_does_not_run_migrations(monkeypatch):
+    """MIGRATION_MODE=skip leaves migrations to the separate runner."""
+
+    async def _run_migrations():
+        raise AssertionError("migrations should not run")
+
+    monkeypatch.setattr(settings, "migration_mode", "skip")
+    monkeypatch.setattr(src.main, "run_migrations", _run_migrations)
+
+    async with src.main.lifespan(src.main.app):
+        pass
+
+
+def test_async_mode_is_rejected():
+    """Background migrations while serving are not supported."""
+    with pytest.raises(ValidationError):
+        Settings(migration_mode="async")
+
+
+def test_get_head_revision_is_cached(monkeypatch):
+    """The script directory is read once, not on every health check."""
+    migrations.get_head_revision.cache_clear()
+    calls = []
+    from_config = ScriptDirectory.from_config
+
+    def _from_config(config):
+        calls.append(config)
+        return from_config(config)
+
+    monkeypatch.setattr(ScriptDirectory, "from_config", _from_config)
+    try:
+        head = migrations.get_head_revision()
+        assert migrations.get_head_revision() == head
+        assert head is not None
+        assert len(calls) == 1
+    finally:
+        migrations.get_head_revision.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_get_current_revision_at_head():
+    """A migrated database reports the head revision."""
+    assert await migrations.get_current_revision() == migrations.get_head_revision()
+
+
+@pytest.mark.asyncio
+async def test_get_current_revision_unmigrated(monkeypatch, session_factory_for):
+    """Without an alembic_version table the database counts as not migrated."""
+    factory = session_factory_for(
+        settings.database_url, server_settings={"search_path": "no_such_schema"}
+    )
+    monkeypatch.setattr(migrations, "AsyncSessionLocal", factory)
+
+    assert await migrations.get_current_revision() is None
+
+
+@pytest.mark.asyncio
+async def test_get_current_revision_surfaces_database_errors(monkeypatch, session_factory_for):
+    """Database errors are raised, not reported as an unmigrated database."""
+    factory = session_factory_for(settings.database_url.rsplit("/", 1)[0] + "/no_such_database")
+    monkeypatch.setattr(migrations, "AsyncSessionLocal", factory)
+
+    with pytest.raises(SQLAlchemyError):
+        await migrations.get_current_revision()
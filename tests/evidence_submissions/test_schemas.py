@@ -0,0 +1,45 @@
+"""Tests for the evidence submission response schemas."""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from src.evidence_submissions.schemas import (
+    EvidenceEvaluationReportResponse,
+    EvidenceSubmissionDetailResponse,
+)
+
+
+def _detail(**fields) -> EvidenceSubmissionDetailResponse:
+    return EvidenceSubmissionDetailResponse(
+        id=uuid4(),
+        audit_workflow_id=uuid4(),
+        audit_workflow_claim_id=uuid4(),
+        file_path="evidence/file.pdf",
+        file_name="file.pdf",
+        status="COMPLETED",
+        created_at=datetime(2026, 1, 1),
+        **fields,
+    )
+
+
+@pytest.mark.parametrize("field", ["extracted_fields", "evaluation_reasons"])
+def test_detail_validates_evaluation_output(field):
+    """Fields filled from the model's evaluation output are still validated."""
+    with pytest.raises(ValidationError):
+        _detail(**{field: ["not", "an", "object"]})
+
+    assert getattr(_detail(**{field: {"key": "value"}}), field) == {"key": "value"}
+
+
+def test_report_validates_gemini_response():
+    """The stored Gemini response is validated before it is returned."""
+    with pytest.raises(ValidationError):
+        EvidenceEvaluationReportResponse(
+            submission_id=uuid4(),
+            file_name="file.pdf",
+            status="COMPLETED",
+            gemini_evaluation_response="raw text",
+        )
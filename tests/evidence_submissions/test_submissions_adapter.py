@@ -0,0 +1,52 @@
+"""Tests for validating a workflow's submissions as one list."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from src.evidence_submissions.router import _SUBMISSIONS_ADAPTER
+from src.evidence_submissions.schemas import EvidenceSubmissionResponse
+
+
+def _submission(**fields) -> SimpleNamespace:
+    return SimpleNamespace(
+        **{
+            "id": uuid4(),
+            "audit_workflow_id": uuid4(),
+            "audit_workflow_claim_id": uuid4(),
+            "file_name": "certificate.pdf",
+            "file_size": 1024,
+            "mime_type": "application/pdf",
+            "status": "COMPLETED",
+            "match_decision": "MATCH",
+            "confidence_score": 88,
+            "created_at": datetime(2026, 1, 1),
+            "processing_completed_at": None,
+            **fields,
+        }
+    )
+
+
+def test_submissions_adapter_matches_model_validate():
+    """Validating the list in one call gives the same items as validating each row."""
+    submissions = [_submission(), _submission(match_decision=None, confidence_score=None)]
+
+    assert _SUBMISSIONS_ADAPTER.validate_python(submissions, from_attributes=True) == [
+        EvidenceSubmissionResponse.model_validate(s, from_attributes=True) for s in submissions
+    ]
+
+
+def test_submissions_adapter_rejects_invalid_row():
+    """One invalid row fails the whole list, as the per-row loop did."""
+    with pytest.raises(ValidationError):
+        _SUBMISSIONS_ADAPTER.validate_python(
+            [_submission(), _submission(file_name=None)], from_attributes=True
+        )
+
+
+def test_submissions_adapter_empty_list():
+    """A workflow without submissions returns an empty list."""
+    assert _SUBMISSIONS_ADAPTER.validate_python([], from_attributes=True) == []
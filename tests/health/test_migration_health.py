@@ -0,0 +1,50 @@
+"""Tests for GET /health/migration."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.exc import OperationalError
+
+from src.core import migrations
+
+
+@pytest.mark.asyncio
+async def test_migration_health_at_head(client: AsyncClient):
+    """A database at the head revision is healthy."""
+    response = await client.get("/health/migration")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "healthy"
+    assert migrations.get_head_revision() in body["checks"]["migration"]["message"]
+
+
+@pytest.mark.asyncio
+async def test_migration_health_behind_head(client: AsyncClient, monkeypatch):
+    """A database behind the head revision is unhealthy."""
+
+    async def _get_current_revision():
+        return "000000000000"
+
+    monkeypatch.setattr(migrations, "get_current_revision", _get_current_revision)
+
+    body = (await client.get("/health/migration")).json()
+
+    assert body["status"] == "unhealthy"
+    assert "Current revision 000000000000" in body["checks"]["migration"]["message"]
+
+
+@pytest.mark.asyncio
+async def test_migration_health_database_error(client: AsyncClient, monkeypatch):
+    """A database error is reported as unhealthy with the error, not as 'not migrated'."""
+
+    async def _get_current_revision():
+        raise OperationalError("SELECT version_num FROM alembic_version", {}, Exception("down"))
+
+    monkeypatch.setattr(migrations, "get_current_revision", _get_current_revision)
+
+    response = await client.get("/health/migration")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "unhealthy"
+    assert body["checks"]["migration"]["message"].startswith("Could not read current revision")
@@ -0,0 +1,65 @@
+"""Tests for POST /api/v1/waitlist and the waitlist email uniqueness."""
+
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.waitlist.models import WaitlistEntry
+
+
+@pytest.fixture
+async def email(db_session: AsyncSession):
+    """A fresh waitlist email, removed again after the test."""
+    address = f"waitlist-{uuid4().hex}@example.com"
+    yield address
+    await db_session.rollback()
+    await db_session.execute(delete(WaitlistEntry).where(WaitlistEntry.email == address))
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_email_has_a_single_unique_index(db_session: AsyncSession):
+    """Email uniqueness is enforced by waitlist_entries_email_key alone."""
+    unique_indexes = (
+        (
+            await db_session.execute(
+                text(
+                    "SELECT i.indexrelid::regclass::text FROM pg_index i "
+                    "JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey) "
+                    "WHERE i.indrelid = 'waitlist_entries'::regclass AND i.indisunique "
+                    "AND a.attname = 'email'"
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    assert unique_indexes == ["waitlist_entries_email_key"]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_email_violates_the_named_constraint(db_session: AsyncSession, email: str):
+    """A duplicate insert fails on the constraint WaitlistService reports duplicates from."""
+    db_session.add(WaitlistEntry(email=email))
+    await db_session.commit()
+
+    db_session.add(WaitlistEntry(email=email))
+    with pytest.raises(IntegrityError, match="waitlist_entries_email_key"):
+        await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_join_waitlist_twice_conflicts(client: AsyncClient, email: str):
+    """Joining with an email already on the list is a 409."""
+    first = await client.post("/api/v1/waitlist", json={"email": email, "name": "Ada"})
+    second = await client.post("/api/v1/waitlist", json={"email": email})
+
+    assert first.status_code == 201
+    assert first.json()["email"] == email
+    assert second.status_code == 409
+    assert second.json()["error"] == "WaitlistEntryExists"